@@ -0,0 +1,36 @@
+"""Optional just-in-time compilation with Numba.
+
+Numba is not a hard requirement. When it is not installed, `njit` returns the
+decorated functions untouched, so the same kernels run as plain Python, and
+`HAS_NUMBA` can be used to skip fast paths that only pay off once compiled.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable
+
+try:
+    import numba
+except ImportError:  # pragma: no cover
+    numba = None
+
+HAS_NUMBA = numba is not None
+
+# Parallel loop, which runs serially without Numba
+prange = numba.prange if HAS_NUMBA else range
+# Threads available to parallel loops
+NUM_THREADS = numba.config.NUMBA_NUM_THREADS if HAS_NUMBA else 1
+
+
+def njit(*args: Any, **kwargs: Any) -> Any:
+    """Drop-in replacement for `numba.njit`, supporting all its call forms."""
+    if HAS_NUMBA:
+        return numba.njit(*args, **kwargs)
+    if len(args) == 1 and callable(args[0]) and not kwargs:
+        # Used as bare `@njit`
+        return args[0]
+
+    def decorator(function: Callable) -> Callable:
+        return function
+
+    return decorator
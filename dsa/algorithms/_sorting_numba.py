@@ -0,0 +1,458 @@
+"""Sorting kernels compiled to native code with Numba.
+
+Each kernel sorts a contiguous, one-dimensional NumPy array of integers or
+floats in place. They follow the same logic as their pure-Python counterparts in
+`dsa.algorithms.sorting`, but every comparison and swap operates on typed
+scalars, instead of boxed Python objects.
+
+Kernels are compiled on their first call for each element type, and cached on
+disk, so that importing this module does not compile anything. Kernels do not
+recurse, and keep pending subarrays on explicit stacks instead, since Numba
+cannot load back from its cache a function that calls a recursive one.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from dsa._jit import NUM_THREADS, njit, prange
+
+# Below that size, spreading work over threads costs more than it saves
+PARALLEL_MIN_SIZE = 2**15
+# Subarrays up to that size are sorted with insertion sort, instead of quicksort
+QUICKSORT_CUTOFF = 16
+# Subarrays up to that size are sorted with insertion sort, instead of being split further by merge sort
+MERGE_SORT_CUTOFF = 16
+# Subarrays larger than that pick their pivot as a ninther, instead of a median of three
+NINTHER_MIN_SIZE = 128
+# Number of elements scanned at once on each side, by block partitioning
+QUICKSORT_BLOCK_SIZE = 64
+# Halvings an array indexed by int64 can go through, which bounds the subarrays waiting on explicit stacks
+STACK_SIZE = 64
+
+
+@njit(cache=True)
+def bubble_sort_compiled(array: np.ndarray) -> None:
+    for size_sorted in range(len(array) - 1):
+        swapped = False
+        for index_bubble in range(len(array) - 1 - size_sorted):
+            if array[index_bubble] > array[index_bubble + 1]:
+                array[index_bubble], array[index_bubble + 1] = array[index_bubble + 1], array[index_bubble]
+                swapped = True
+        if not swapped:
+            break
+
+
+# Kernels are compiled eagerly, so callees must be defined before their callers
+@njit(cache=True)
+def _insertion_sort_range_compiled(array: np.ndarray, index_left: int, index_right: int) -> None:
+    for index_to_be_sorted in range(index_left + 1, index_right):
+        value = array[index_to_be_sorted]
+        index = index_to_be_sorted
+        while index > index_left and array[index - 1] > value:
+            array[index] = array[index - 1]
+            index -= 1
+        array[index] = value
+
+
+@njit(cache=True)
+def insertion_sort_compiled(array: np.ndarray) -> None:
+    _insertion_sort_range_compiled(array, 0, len(array))
+
+
+@njit(cache=True)
+def selection_sort_compiled(array: np.ndarray) -> None:
+    for size_sorted in range(len(array) - 1):
+        index_min = size_sorted
+        for index in range(size_sorted + 1, len(array)):
+            if array[index] < array[index_min]:
+                index_min = index
+        array[size_sorted], array[index_min] = array[index_min], array[size_sorted]
+
+
+@njit(cache=True)
+def _merge_ranges(
+    source: np.ndarray,
+    target: np.ndarray,
+    index_sub_left: int,
+    index_sub_left_end: int,
+    index_sub_right: int,
+    index_sub_right_end: int,
+    index_target: int,
+) -> None:
+    # Merge sorted source[index_sub_left:index_sub_left_end] and
+    # source[index_sub_right:index_sub_right_end] into target, from index_target on.
+    while index_sub_left < index_sub_left_end and index_sub_right < index_sub_right_end:
+        value_left = source[index_sub_left]
+        value_right = source[index_sub_right]
+        # On random input, the comparison is unpredictable. Using its outcome as
+        # a number, instead of branching on it, lets LLVM emit conditional moves.
+        take_left = int(value_left <= value_right)
+        target[index_target] = value_left if take_left else value_right
+        index_sub_left += take_left
+        index_sub_right += 1 - take_left
+        index_target += 1
+    # One run is exhausted, so the rest of the other one is copied as it is
+    size_left = index_sub_left_end - index_sub_left
+    target[index_target : index_target + size_left] = source[index_sub_left:index_sub_left_end]
+    index_target += size_left
+    size_right = index_sub_right_end - index_sub_right
+    target[index_target : index_target + size_right] = source[index_sub_right:index_sub_right_end]
+
+
+@njit(cache=True)
+def sort_and_merge_compiled(
+    source: np.ndarray, target: np.ndarray, index_left: int, index_middle: int, index_right: int
+) -> None:
+    _merge_ranges(source, target, index_left, index_middle, index_middle, index_right, index_left)
+
+
+@njit(cache=True)
+def _co_rank(source: np.ndarray, index_left: int, index_middle: int, index_right: int, size_output: int) -> int:
+    """Return how many of the first `size_output` merged elements come from the left run.
+
+    Binary search over the candidate splits: if the left run contributes
+    `size_left` elements, the right one contributes `size_output - size_left`.
+    The split is too small, as long as the next left element would be merged
+    before the last right one.
+    """
+    size_left_min = max(0, size_output - (index_right - index_middle))
+    size_left_max = min(size_output, index_middle - index_left)
+    while size_left_min < size_left_max:
+        size_left = (size_left_min + size_left_max) // 2
+        size_right = size_output - size_left
+        if source[index_left + size_left] <= source[index_middle + size_right - 1]:
+            size_left_min = size_left + 1
+        else:
+            size_left_max = size_left
+    return size_left_min
+
+
+@njit(cache=True, parallel=True)
+def sort_and_merge_parallel_compiled(
+    source: np.ndarray, target: np.ndarray, index_left: int, index_middle: int, index_right: int, num_pieces: int
+) -> None:
+    """Merge path: split a single merge into independent pieces of equal size.
+
+    Each piece covers a contiguous part of the merged output. Where it starts
+    in each of the two runs is found by binary search (co-ranking), so that all
+    pieces can be merged in parallel.
+    """
+    size = index_right - index_left
+    for index_piece in prange(num_pieces):
+        size_output_start = size * index_piece // num_pieces
+        size_output_end = size * (index_piece + 1) // num_pieces
+        size_left_start = _co_rank(source, index_left, index_middle, index_right, size_output_start)
+        size_left_end = _co_rank(source, index_left, index_middle, index_right, size_output_end)
+        _merge_ranges(
+            source,
+            target,
+            index_left + size_left_start,
+            index_left + size_left_end,
+            index_middle + size_output_start - size_left_start,
+            index_middle + size_output_end - size_left_end,
+            index_left + size_output_start,
+        )
+
+
+@njit(cache=True)
+def _merge_sort_top_down_compiled(array: np.ndarray, buffer: np.ndarray) -> None:
+    """Sort array into buffer, splitting it in halves as the recursive version does.
+
+    Subarrays are visited with an explicit stack of (index_left, index_right,
+    depth, is_split) frames. Halves are sorted into the other array than their
+    parent, so that array and buffer swap roles from one depth to the next.
+    """
+    frames = np.empty((2 * STACK_SIZE, 4), dtype=np.int64)
+    frames[0, 0], frames[0, 1], frames[0, 2], frames[0, 3] = 0, len(array), 0, 0
+    num_frames = 1
+    while num_frames > 0:
+        num_frames -= 1
+        index_left, index_right = frames[num_frames, 0], frames[num_frames, 1]
+        depth, is_split = frames[num_frames, 2], frames[num_frames, 3]
+        source, target = (array, buffer) if depth % 2 == 0 else (buffer, array)
+        if index_right - index_left <= MERGE_SORT_CUTOFF:
+            _insertion_sort_range_compiled(target, index_left, index_right)
+            continue
+        index_middle = (index_left + index_right) // 2
+        if is_split:
+            sort_and_merge_compiled(source, target, index_left, index_middle, index_right)
+            continue
+        # Merged once both halves, stacked on top of it, are sorted
+        frames[num_frames, 3] = 1
+        frames[num_frames + 1, 0], frames[num_frames + 1, 1] = index_left, index_middle
+        frames[num_frames + 2, 0], frames[num_frames + 2, 1] = index_middle, index_right
+        frames[num_frames + 1, 2] = frames[num_frames + 2, 2] = depth + 1
+        frames[num_frames + 1, 3] = frames[num_frames + 2, 3] = 0
+        num_frames += 3
+
+
+@njit(cache=True)
+def merge_sort_top_down_compiled(array: np.ndarray) -> None:
+    target = array.copy()
+    _merge_sort_top_down_compiled(array, target)
+    array[:] = target
+
+
+@njit(cache=True)
+def _merge_pair_of_width(source: np.ndarray, target: np.ndarray, index_merge: int, width: int) -> None:
+    total_size = len(source)
+    index_left = index_merge * 2 * width
+    index_middle = min(index_left + width, total_size)
+    index_right = min(index_left + 2 * width, total_size)
+    sort_and_merge_compiled(source, target, index_left, index_middle, index_right)
+
+
+@njit(cache=True, parallel=True)
+def merge_sort_bottom_up_compiled(array: np.ndarray) -> None:
+    source = array
+    target = array.copy()
+    total_size = len(array)
+    width = 1
+    while width < total_size:
+        source, target = target, source
+        num_merges = (total_size + 2 * width - 1) // (2 * width)
+        if total_size < PARALLEL_MIN_SIZE:
+            for index_merge in range(num_merges):
+                _merge_pair_of_width(source, target, index_merge, width)
+        elif num_merges >= NUM_THREADS:
+            # Merges of the same width touch disjoint subarrays, so they can run
+            # in parallel, without the GIL.
+            for index_merge in prange(num_merges):
+                _merge_pair_of_width(source, target, index_merge, width)
+        else:
+            # Too few merges to keep all threads busy, so split each one instead
+            for index_merge in range(num_merges):
+                index_left = index_merge * 2 * width
+                index_middle = min(index_left + width, total_size)
+                index_right = min(index_left + 2 * width, total_size)
+                sort_and_merge_parallel_compiled(source, target, index_left, index_middle, index_right, NUM_THREADS)
+        width *= 2
+    # The sorted values end up in either buffer, depending on the number of passes
+    array[:] = target
+
+
+@njit(cache=True)
+def _sift_down_compiled(array: np.ndarray, index_offset: int, index_root: int, size_heap: int) -> None:
+    # Move root down the max heap stored in array[index_offset:index_offset + size_heap],
+    # until it is no smaller than its children
+    value = array[index_offset + index_root]
+    while True:
+        index_child = 2 * index_root + 1
+        if index_child >= size_heap:
+            break
+        if index_child + 1 < size_heap and array[index_offset + index_child + 1] > array[index_offset + index_child]:
+            index_child += 1
+        if array[index_offset + index_child] <= value:
+            break
+        array[index_offset + index_root] = array[index_offset + index_child]
+        index_root = index_child
+    array[index_offset + index_root] = value
+
+
+@njit(cache=True)
+def _heap_sort_range_compiled(array: np.ndarray, index_left: int, index_right: int) -> None:
+    # In place, with a max heap, unlike heapq: the largest element is
+    # repeatedly swapped to the end of the heap, which then shrinks by one.
+    size = index_right - index_left
+    for index_root in range(size // 2 - 1, -1, -1):
+        _sift_down_compiled(array, index_left, index_root, size)
+    for size_heap in range(size - 1, 0, -1):
+        array[index_left], array[index_left + size_heap] = array[index_left + size_heap], array[index_left]
+        _sift_down_compiled(array, index_left, 0, size_heap)
+
+
+@njit(cache=True)
+def _get_depth_limit_compiled(size: int) -> int:
+    # Twice the bit length of size, as in the pure-Python version
+    depth_limit = 0
+    while size > 0:
+        size >>= 1
+        depth_limit += 2
+    return depth_limit
+
+
+@njit(cache=True)
+def _median_of_three_compiled(array: np.ndarray, index_1: int, index_2: int, index_3: int) -> int:
+    if array[index_1] > array[index_2]:
+        index_1, index_2 = index_2, index_1
+    if array[index_2] > array[index_3]:
+        index_2, index_3 = index_3, index_2
+        if array[index_1] > array[index_2]:
+            index_1, index_2 = index_2, index_1
+    return index_2
+
+
+@njit(cache=True)
+def _select_pivot_compiled(array: np.ndarray, index_left: int, index_right: int) -> int:
+    index_middle = (index_left + index_right) // 2
+    index_last = index_right - 1
+    if index_right - index_left <= NINTHER_MIN_SIZE:
+        return _median_of_three_compiled(array, index_left, index_middle, index_last)
+    step = (index_right - index_left) // 8
+    return _median_of_three_compiled(
+        array,
+        _median_of_three_compiled(array, index_left, index_left + step, index_left + 2 * step),
+        _median_of_three_compiled(array, index_middle - step, index_middle, index_middle + step),
+        _median_of_three_compiled(array, index_last - 2 * step, index_last - step, index_last),
+    )
+
+
+@njit(cache=True)
+def _defer_larger_side_compiled(
+    pending: np.ndarray, num_pending: int, index_left: int, index_pivot: int, index_right: int, depth_left: int
+) -> tuple[int, int, int]:
+    """Push the larger side of a partition on pending, and return the smaller one and the new stack size.
+
+    The smaller side is sorted first, so that it is at most half as large as the
+    subarray pushed before it, and no more than log2(N) subarrays wait at once.
+    """
+    if index_pivot - index_left < index_right - index_pivot:
+        pending[num_pending, 0], pending[num_pending, 1] = index_pivot + 1, index_right
+        index_right = index_pivot
+    else:
+        pending[num_pending, 0], pending[num_pending, 1] = index_left, index_pivot
+        index_left = index_pivot + 1
+    pending[num_pending, 2] = depth_left
+    return index_left, index_right, num_pending + 1
+
+
+@njit(cache=True)
+def _quicksort_lomuto_compiled(array: np.ndarray, index_left: int, index_right: int, depth_left: int) -> None:
+    # Subarrays left to sort, as (index_left, index_right, depth_left)
+    pending = np.empty((STACK_SIZE, 3), dtype=np.int64)
+    num_pending = 0
+    while True:
+        while index_right - index_left > QUICKSORT_CUTOFF:
+            if depth_left == 0:
+                _heap_sort_range_compiled(array, index_left, index_right)
+                break
+            depth_left -= 1
+            index_median = _select_pivot_compiled(array, index_left, index_right)
+            array[index_median], array[index_right - 1] = array[index_right - 1], array[index_median]
+            value_pivot = array[index_right - 1]
+            index_pivot = index_left
+            for index in range(index_left, index_right - 1):
+                if array[index] <= value_pivot:
+                    array[index_pivot], array[index] = array[index], array[index_pivot]
+                    index_pivot += 1
+            array[index_pivot], array[index_right - 1] = array[index_right - 1], array[index_pivot]
+
+            index_left, index_right, num_pending = _defer_larger_side_compiled(
+                pending, num_pending, index_left, index_pivot, index_right, depth_left
+            )
+        else:
+            _insertion_sort_range_compiled(array, index_left, index_right)
+        if num_pending == 0:
+            return
+        num_pending -= 1
+        index_left, index_right, depth_left = pending[num_pending, 0], pending[num_pending, 1], pending[num_pending, 2]
+
+
+@njit(cache=True)
+def quicksort_lomuto_compiled(array: np.ndarray) -> None:
+    _quicksort_lomuto_compiled(array, 0, len(array), _get_depth_limit_compiled(len(array)))
+
+
+@njit(cache=True)
+def _partition_hoare_block_compiled(
+    array: np.ndarray, index_left: int, index_right: int, offsets_left: np.ndarray, offsets_right: np.ndarray
+) -> int:
+    """Partition subarray around its first element, and return the final index of the latter.
+
+    Block partitioning (BlockQuicksort): instead of scanning from both ends until
+    a misplaced element is found, which branches unpredictably on every element,
+    a whole block is scanned on each side first. The offsets of its misplaced
+    elements are recorded, by always writing the offset and only advancing the
+    count if the element is misplaced. Misplaced elements are then swapped in
+    bulk. The few elements left in between go through the usual Hoare scans.
+    Unlike in the pure-Python `_quicksort_hoare_impl`, the pivot is excluded
+    from the partition, and put in its final place at the end.
+    """
+    value_pivot = array[index_left]
+    index_sub_left = index_left + 1
+    index_sub_right = index_right - 1
+    num_left = num_right = 0
+    start_left = start_right = 0
+    while index_sub_right - index_sub_left + 1 >= 2 * QUICKSORT_BLOCK_SIZE:
+        if num_left == 0:
+            start_left = 0
+            for offset in range(QUICKSORT_BLOCK_SIZE):
+                offsets_left[num_left] = offset
+                num_left += int(array[index_sub_left + offset] >= value_pivot)
+        if num_right == 0:
+            start_right = 0
+            for offset in range(QUICKSORT_BLOCK_SIZE):
+                offsets_right[num_right] = offset
+                num_right += int(array[index_sub_right - offset] <= value_pivot)
+        num_swaps = min(num_left, num_right)
+        for index_swap in range(num_swaps):
+            index_1 = index_sub_left + offsets_left[start_left + index_swap]
+            index_2 = index_sub_right - offsets_right[start_right + index_swap]
+            array[index_1], array[index_2] = array[index_2], array[index_1]
+        num_left -= num_swaps
+        num_right -= num_swaps
+        start_left += num_swaps
+        start_right += num_swaps
+        # Only move past a block, once none of its elements is misplaced
+        if num_left == 0:
+            index_sub_left += QUICKSORT_BLOCK_SIZE
+        if num_right == 0:
+            index_sub_right -= QUICKSORT_BLOCK_SIZE
+
+    # Everything before index_sub_left is no larger than the pivot, and
+    # everything after index_sub_right is no smaller
+    while True:
+        while index_sub_left <= index_sub_right and array[index_sub_left] < value_pivot:
+            index_sub_left += 1
+        while index_sub_left <= index_sub_right and array[index_sub_right] > value_pivot:
+            index_sub_right -= 1
+        if index_sub_left >= index_sub_right:
+            break
+        array[index_sub_left], array[index_sub_right] = array[index_sub_right], array[index_sub_left]
+        index_sub_left += 1
+        index_sub_right -= 1
+    index_pivot = index_sub_left - 1
+    array[index_left], array[index_pivot] = array[index_pivot], array[index_left]
+    return index_pivot
+
+
+@njit(cache=True)
+def _quicksort_hoare_compiled(
+    array: np.ndarray,
+    index_left: int,
+    index_right: int,
+    depth_left: int,
+    offsets_left: np.ndarray,
+    offsets_right: np.ndarray,
+) -> None:
+    # Subarrays left to sort, as (index_left, index_right, depth_left)
+    pending = np.empty((STACK_SIZE, 3), dtype=np.int64)
+    num_pending = 0
+    while True:
+        while index_right - index_left > QUICKSORT_CUTOFF:
+            if depth_left == 0:
+                _heap_sort_range_compiled(array, index_left, index_right)
+                break
+            depth_left -= 1
+            index_median = _select_pivot_compiled(array, index_left, index_right)
+            array[index_median], array[index_left] = array[index_left], array[index_median]
+            index_pivot = _partition_hoare_block_compiled(array, index_left, index_right, offsets_left, offsets_right)
+
+            index_left, index_right, num_pending = _defer_larger_side_compiled(
+                pending, num_pending, index_left, index_pivot, index_right, depth_left
+            )
+        else:
+            _insertion_sort_range_compiled(array, index_left, index_right)
+        if num_pending == 0:
+            return
+        num_pending -= 1
+        index_left, index_right, depth_left = pending[num_pending, 0], pending[num_pending, 1], pending[num_pending, 2]
+
+
+@njit(cache=True)
+def quicksort_hoare_compiled(array: np.ndarray) -> None:
+    # Shared by all partitions, which run one after the other
+    offsets_left = np.empty(QUICKSORT_BLOCK_SIZE, dtype=np.int64)
+    offsets_right = np.empty(QUICKSORT_BLOCK_SIZE, dtype=np.int64)
+    _quicksort_hoare_compiled(array, 0, len(array), _get_depth_limit_compiled(len(array)), offsets_left, offsets_right)
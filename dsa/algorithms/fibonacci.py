@@ -2,6 +2,13 @@ from __future__ import annotations
 
 from typing import Protocol
 
+from dsa._jit import HAS_NUMBA, njit
+
+# Above this order, brute force takes seconds, so we fall back to fast doubling
+BRUTE_FORCE_MAX_N = 30
+# Largest order whose Fibonacci number fits in a signed 64-bit integer
+INT64_MAX_N = 92
+
 
 class FibonacciAlgorithm(Protocol):
     """Given a positive integer `n`, find the n-th Fibonacci number."""
@@ -12,12 +19,17 @@ class FibonacciAlgorithm(Protocol):
 def fibonacci_brute_force(n: int) -> int:
     """Brute-force recursive approach.
 
+    For `n > BRUTE_FORCE_MAX_N`, the computation is delegated to
+    `fibonacci_fast_doubling`, since the exponential cost becomes prohibitive.
+
     Complexity
     ----------
     Time: O(2**N)
     Space: O(N)
     """
     assert n >= 0
+    if n > BRUTE_FORCE_MAX_N:
+        return fibonacci_fast_doubling(n)
     if n < 2:
         return n
     return fibonacci_brute_force(n - 1) + fibonacci_brute_force(n - 2)
@@ -27,23 +39,32 @@ def fibonacci_memoization(n: int) -> int:
     """Memoization recursive approach (top-down storage).
 
     In memoization we store the output of function calls in a table (recursion).
+    Here, the table is a module-level dictionary, shared between calls, so
+    repeated queries are answered directly from it.
+
+    The table is filled in increasing order, so that each recursive call only
+    goes one level deep, and large `n` cannot hit the recursion limit. This
+    also means it always holds all orders up to its size.
 
     Complexity
     ----------
-    Time: O(N)
+    Time: O(N) for the first call, O(1) for already computed orders
     Space: O(N)
     """
-    table = (n + 1) * [None]
+    assert n >= 0
+    for m in range(len(_fibonacci_table), n):
+        _fibonacci_cached(m)
+    return _fibonacci_cached(n)
 
-    def fibonacci_cached(n: int) -> int:
-        assert n >= 0
-        if n < 2:
-            return n
-        if table[n] is None:
-            table[n] = fibonacci_cached(n - 1) + fibonacci_cached(n - 2)
-        return table[n]
 
-    return fibonacci_cached(n)
+# Fibonacci numbers computed so far, shared between calls
+_fibonacci_table: dict[int, int] = {0: 0, 1: 1}
+
+
+def _fibonacci_cached(n: int) -> int:
+    if n not in _fibonacci_table:
+        _fibonacci_table[n] = _fibonacci_cached(n - 1) + _fibonacci_cached(n - 2)
+    return _fibonacci_table[n]
 
 
 def fibonacci_tabulation(n: int) -> int:
@@ -68,16 +89,57 @@ def fibonacci_tabulation(n: int) -> int:
 def fibonacci_tabulation_spaced_optimized(n: int) -> int:
     """Space-optimized tabulation iterative approach (bottom-up storage).
 
+    When Numba is available and the result fits in 64 bits, the loop runs as
+    compiled native code instead.
+
     Complexity
     ----------
     Time: O(N)
     Space: O(1)
     """
     assert n >= 0
+    if HAS_NUMBA and n <= INT64_MAX_N:
+        return int(_fibonacci_iterative_int64(n))
     if n < 2:
         return n
     value_1, value_2 = 0, 1
     for _ in range(2, n + 1):
-        current = value_1 + value_2
-        value_1, value_2 = value_2, current
-    return current
+        value_1, value_2 = value_2, value_1 + value_2
+    return value_2
+
+
+@njit("int64(int64)", cache=True)
+def _fibonacci_iterative_int64(n: int) -> int:
+    value_1, value_2 = 0, 1
+    for _ in range(n):
+        value_1, value_2 = value_2, value_1 + value_2
+    return value_1
+
+
+def fibonacci_fast_doubling(n: int) -> int:
+    """Fast doubling iterative approach.
+
+    Derived from the matrix form of the recurrence, [[1, 1], [1, 0]]**n, which
+    yields the identities:
+        F(2k) = F(k) * (2 * F(k + 1) - F(k))
+        F(2k + 1) = F(k)**2 + F(k + 1)**2
+
+    Going through the bits of `n` from the most to the least significant one,
+    we keep track of the pair (F(k), F(k + 1)), doubling `k` at each step, and
+    incrementing it by one whenever the bit is set.
+
+    Complexity
+    ----------
+    Time: O(log N) big-integer multiplications
+    Space: O(1)
+    """
+    assert n >= 0
+    value_k, value_k_plus_1 = 0, 1
+    for bit in bin(n)[2:]:
+        value_2k = value_k * (2 * value_k_plus_1 - value_k)
+        value_2k_plus_1 = value_k * value_k + value_k_plus_1 * value_k_plus_1
+        if bit == "0":
+            value_k, value_k_plus_1 = value_2k, value_2k_plus_1
+        else:
+            value_k, value_k_plus_1 = value_2k_plus_1, value_2k + value_2k_plus_1
+    return value_k
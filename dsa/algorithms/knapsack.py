@@ -2,6 +2,10 @@ from __future__ import annotations
 
 from typing import Protocol, Sequence, TypeAlias
 
+import numpy as np
+
+from dsa._jit import HAS_NUMBA, njit
+
 WeightAndProfitType: TypeAlias = tuple[int, int]
 
 
@@ -28,6 +32,7 @@ def knapsack_brute_force(weights_and_profits: Sequence[WeightAndProfitType], cap
     Time: O(2**N)
     Space: O(N)
     """
+    _check_weights(weights_and_profits)
 
     def compute_max_profit(n_items_left: int, capacity_left: int) -> int:
         if n_items_left == 0 or capacity_left == 0:
@@ -47,61 +52,138 @@ def knapsack_brute_force(weights_and_profits: Sequence[WeightAndProfitType], cap
 
 
 def knapsack_memoization(weights_and_profits: Sequence[WeightAndProfitType], capacity: int) -> int:
-    """Memoization recursive solution to knapsack problem (top-down).
+    """Memoization solution to knapsack problem (top-down).
+
+    Subproblems are solved on demand, starting from the full problem, and only
+    those actually reached get stored. Instead of recursion, an explicit stack
+    of pending subproblems is used, which avoids the function call overhead
+    and cannot hit the recursion limit.
 
     Complexity
     ----------
     Time: O(N x capacity)
     Space: O(N x capacity)
     """
-    table = [[None for _ in range(capacity + 1)] for _ in range(len(weights_and_profits) + 1)]
-
-    def compute_max_profit(n_items_left: int, capacity_left: int) -> int:
-        if table[n_items_left][capacity_left] is not None:
-            # Already computed, return cache
-            return table[n_items_left][capacity_left]
+    _check_weights(weights_and_profits)
+    # Maps (n_items_left, capacity_left) to the max profit of that subproblem
+    table: dict[tuple[int, int], int] = {}
+    stack = [(len(weights_and_profits), capacity)]
+    while stack:
+        n_items_left, capacity_left = subproblem = stack[-1]
+        if subproblem in table:
+            # Already computed, through another path
+            stack.pop()
+            continue
         if n_items_left == 0 or capacity_left == 0:
             # Nothing more to do
-            table[n_items_left][capacity_left] = 0
-            return table[n_items_left][capacity_left]
+            table[subproblem] = 0
+            stack.pop()
+            continue
         # Pick next item
         weight_item, profit_item = weights_and_profits[n_items_left - 1]
-        if weight_item > capacity_left:
+        subproblem_item_excluded = (n_items_left - 1, capacity_left)
+        subproblem_item_included = (n_items_left - 1, capacity_left - weight_item)
+        item_fits = weight_item <= capacity_left
+        subproblems_next = (
+            [subproblem_item_excluded, subproblem_item_included] if item_fits else [subproblem_item_excluded]
+        )
+        # Solve smaller subproblems first, and come back to this one afterwards
+        subproblems_pending = [subproblem_next for subproblem_next in subproblems_next if subproblem_next not in table]
+        if subproblems_pending:
+            stack.extend(subproblems_pending)
+            continue
+        stack.pop()
+        if not item_fits:
             # Item cannot fit, so it gets dropped
-            table[n_items_left][capacity_left] = compute_max_profit(n_items_left - 1, capacity_left)
-            return table[n_items_left][capacity_left]
+            table[subproblem] = table[subproblem_item_excluded]
+            continue
         # Decide if it is profitable to include item or not
-        profits_item_included = compute_max_profit(n_items_left - 1, capacity_left - weight_item) + profit_item
-        profits_item_excluded = compute_max_profit(n_items_left - 1, capacity_left)
-        table[n_items_left][capacity_left] = max(profits_item_included, profits_item_excluded)
-        return table[n_items_left][capacity_left]
+        profits_item_included = table[subproblem_item_included] + profit_item
+        profits_item_excluded = table[subproblem_item_excluded]
+        table[subproblem] = max(profits_item_included, profits_item_excluded)
 
-    return compute_max_profit(n_items_left=len(weights_and_profits), capacity_left=capacity)
+    return table[(len(weights_and_profits), capacity)]
 
 
 def knapsack_tabulation(weights_and_profits: Sequence[WeightAndProfitType], capacity: int) -> int:
     """Tabulation iterative solution to knapsack problem (bottom-up).
 
+    Each row of the table only depends on the previous one, so a single row is
+    kept and updated in place, item by item. The update is computed at once
+    with vectorized NumPy operations, instead of cell by cell. Since the
+    "included" profits are computed from a copy of the row before it gets
+    overwritten, each item is used at most once.
+
+    When Numba is available, the same update runs as a compiled scalar loop
+    over typed arrays, which avoids allocating a temporary row per item.
+
+    Weights and profits are stored as 32-bit integers, which halves memory
+    traffic compared to 64-bit ones. When the capacity or the total profit do
+    not fit in 32 bits, 64-bit integers are used instead.
+
     Complexity
     ----------
     Time: O(N x capacity)
-    Space: O(N x capacity)
+    Space: O(capacity)
+    """
+    _check_weights(weights_and_profits)
+    # Items that cannot fit for any capacity get dropped
+    weights_and_profits = [(weight, profit) for weight, profit in weights_and_profits if weight <= capacity]
+    # Every partial sum of profits is bounded by this
+    profit_bound = sum(abs(profit) for _, profit in weights_and_profits)
+    if max(capacity, profit_bound) < 2**31:
+        dtype = np.int32
+    elif max(capacity, profit_bound) < 2**63:
+        dtype = np.int64
+    else:
+        raise ValueError("Capacity and total profit must fit in 64 bits")
+    weights, profits = _split_weights_and_profits(weights_and_profits, dtype)
+    if HAS_NUMBA:
+        return int(_knapsack_tabulation_compiled(weights, profits, capacity))
+
+    # Max profit for each capacity, considering the items processed so far
+    max_profits = np.zeros(capacity + 1, dtype=dtype)
+    for weight_item, profit_item in zip(weights, profits):
+        # Decide if it is profitable to include item or not, for all capacities
+        # where it fits. Including it leaves `weight_item` less capacity.
+        profits_item_included = max_profits[: capacity + 1 - weight_item] + profit_item
+        np.maximum(max_profits[weight_item:], profits_item_included, out=max_profits[weight_item:])
+    return int(max_profits[capacity])
+
+
+def _check_weights(weights_and_profits: Sequence[WeightAndProfitType]) -> None:
+    """Reject items without weight.
+
+    Such an item fits even when no capacity is left, which the subproblems
+    stopping at zero capacity do not account for.
+    """
+    if any(weight < 1 for weight, _ in weights_and_profits):
+        raise ValueError("Item weights must be positive")
+
+
+def _split_weights_and_profits(
+    weights_and_profits: Sequence[WeightAndProfitType], dtype: type[np.integer]
+) -> tuple[np.ndarray, np.ndarray]:
+    """Convert (weight, profit) pairs into separate contiguous arrays.
+
+    Array-based kernels only need one of the two fields at a time, so storing
+    them separately (struct of arrays) keeps each access contiguous, instead of
+    going through a tuple per item (array of structs).
     """
-    n_items = len(weights_and_profits)
-    table = [[None for _ in range(capacity + 1)] for _ in range(n_items + 1)]
-    for n_items_left in range(n_items + 1):
-        for capacity_left in range(capacity + 1):
-            if n_items_left == 0 or capacity_left == 0:
-                # Nothing more to do
-                table[n_items_left][capacity_left] = 0
-                continue
-            weight_item, profit_item = weights_and_profits[n_items_left - 1]
-            if weight_item > capacity_left:
-                # Item cannot fit, so it gets dropped
-                table[n_items_left][capacity_left] = table[n_items_left - 1][capacity_left]
-                continue
-            # Decide if it is profitable to include item or not
-            profits_item_included = table[n_items_left - 1][capacity_left - weight_item] + profit_item
-            profits_item_excluded = table[n_items_left - 1][capacity_left]
-            table[n_items_left][capacity_left] = max(profits_item_included, profits_item_excluded)
-    return table[n_items][capacity]
+    weights = np.fromiter((weight for weight, _ in weights_and_profits), dtype=dtype, count=len(weights_and_profits))
+    profits = np.fromiter((profit for _, profit in weights_and_profits), dtype=dtype, count=len(weights_and_profits))
+    return weights, profits
+
+
+@njit(["int32(int32[::1], int32[::1], int64)", "int64(int64[::1], int64[::1], int64)"], cache=True)
+def _knapsack_tabulation_compiled(weights: np.ndarray, profits: np.ndarray, capacity: int) -> int:
+    max_profits = np.zeros(capacity + 1, dtype=profits.dtype)
+    for index_item in range(weights.shape[0]):
+        weight_item = weights[index_item]
+        profit_item = profits[index_item]
+        # Go from right to left, so that each item is included at most once
+        for capacity_left in range(capacity, weight_item - 1, -1):
+            profits_item_included = max_profits[capacity_left - weight_item] + profit_item
+            if profits_item_included > max_profits[capacity_left]:
+                max_profits[capacity_left] = profits_item_included
+    return max_profits[capacity]
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import bisect
 from typing import Protocol, TypeVar
 
+import numpy as np
+
 ValueType = TypeVar("ValueType")
 
 
@@ -35,7 +38,19 @@ def linear_search(array: list[ValueType], value: ValueType) -> int:
     ----
     - Poor performance
     """
-    assert list(array) == sorted(array)
+    if isinstance(array, list):
+        # Same algorithm, implemented in C by the list itself
+        try:
+            return array.index(value)
+        except ValueError:
+            raise NotFoundError from None
+    if isinstance(array, np.ndarray):
+        # Vectorized comparison of all elements at once
+        indices_found = np.flatnonzero(array == value)
+        if indices_found.size == 0:
+            raise NotFoundError
+        return int(indices_found[0])
+
     for index, value_stored in enumerate(array):
         if value_stored == value:
             return index
@@ -46,6 +61,8 @@ def binary_search_recursive(array: list[ValueType], value: ValueType) -> int:
     """Recursive binary search algorithm.
 
     Recursively halve search interval in sorted array, until value is found.
+    The array is assumed to be sorted in ascending order. This is not checked,
+    as it would cost O(N log N), far more than the search itself.
 
     Complexity
     ----------
@@ -60,7 +77,6 @@ def binary_search_recursive(array: list[ValueType], value: ValueType) -> int:
     ----
     - Requires sorting
     """
-    assert list(array) == sorted(array)
 
     def search_subarray(index_start: int, index_end: int) -> int:
         if index_start == index_end:
@@ -84,6 +100,8 @@ def binary_search_iterative(array: list[ValueType], value: ValueType) -> int:
     """Iterative binary search algorithm.
 
     Recursively halve search interval in sorted array, until value is found.
+    The array is assumed to be sorted in ascending order. This is not checked,
+    as it would cost O(N log N), far more than the search itself.
 
     Complexity
     ----------
@@ -98,21 +116,31 @@ def binary_search_iterative(array: list[ValueType], value: ValueType) -> int:
     ----
     - Requires sorting
     """
-    assert list(array) == sorted(array)
+    if isinstance(array, list):
+        # Same algorithm, implemented in C by the standard library
+        index = bisect.bisect_left(array, value)
+        if index < len(array) and array[index] == value:
+            return index
+        raise NotFoundError
 
-    # Initialization
+    # Initialization: search interval [index_left, index_left + size)
     index_left = 0
-    index_right = len(array)
-
-    while index_left < index_right:
-        index_middle = (index_left + index_right) // 2
-        if value == array[index_middle]:
-            # Value found
-            return index_middle
-        elif value < array[index_middle]:
-            # Search in left subarray
-            index_right = index_middle
-        else:
-            # Search in right subarray
-            index_left = index_middle + 1
+    size = len(array)
+    if size == 0:
+        raise NotFoundError
+
+    while size > 1:
+        # Keep left or right half of search interval. Instead of branching, the
+        # comparison result (0 or 1) decides how much the interval shifts, so
+        # there is no hard-to-predict if/else.
+        size_half = size // 2
+        index_left += size_half * (array[index_left + size_half] < value)
+        size -= size_half
+
+    # Interval has a single element left, which is either the value, or the
+    # one right before its insertion point.
+    index_left += array[index_left] < value
+    if index_left < len(array) and array[index_left] == value:
+        # Comparisons of NumPy scalars turn the index into a NumPy integer
+        return int(index_left)
     raise NotFoundError
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
-import collections
 import heapq
 import math
 from typing import Callable, NamedTuple, Protocol
 
+import numpy as np
+
+from dsa._jit import njit
 from dsa.data_structures import graphs
 
 
@@ -55,7 +57,9 @@ def a_star_search_algorithm(
     `guess_min_distance_from_target` is a problem-specific heuristic function
     for estimating the distance of a given node from the target node. If it
     is admissible, i.e., it never overestimates the actual distance, it is
-    guaranteed to lead to the right solution.
+    guaranteed to lead to the right solution. Since visited nodes are never
+    revisited, it should also be consistent, i.e., the guess for a node should
+    not exceed the guess for its neighbor plus the distance between them.
 
     In the special case where it is a constant (no guessing), the A* algorithm
     reduces to Dijkstra's algorithm.
@@ -66,21 +70,34 @@ def a_star_search_algorithm(
     Space: O(V)
     """
     # Step 1: Initialize
-    # We use a min-priority queue for efficiency (original uses set)
+    # We use a min-priority queue for efficiency (original uses set). Since
+    # heaps do not support decreasing a key, a node is pushed again whenever
+    # a shorter distance is found, and outdated entries are skipped when popped.
     unvisited_nodes = [(0.0, source)]
+    visited_nodes: set[graphs.ValueType] = set()
     # Used to reconstruct the final path
     node_to_min_previous_node: dict[graphs.ValueType, graphs.ValueType] = {}
-    # g-score: computed min distance of a node from the source
-    node_to_min_distance_from_source = collections.defaultdict(lambda: math.inf)
-    node_to_min_distance_from_source[source] = 0.0
+    # g-score: computed min distance of a node from the source (infinite if
+    # not found yet)
+    node_to_min_distance_from_source: dict[graphs.ValueType, graphs.WeightType] = {source: 0.0}
+    # h-score: guessed min distance of a node from the target. The heuristic
+    # only depends on the node, so it is computed at most once per node.
+    node_to_guess_min_distance_from_target: dict[graphs.ValueType, graphs.WeightType] = {
+        source: guess_min_distance_from_target(graph, source, target)
+    }
     # f-score: estimated min distance from source to target through node
-    node_to_min_distance_from_source_to_target = collections.defaultdict(lambda: math.inf)
-    node_to_min_distance_from_source_to_target[source] = guess_min_distance_from_target(graph, source, target)
+    node_to_min_distance_from_source_to_target: dict[graphs.ValueType, graphs.WeightType] = {
+        source: node_to_guess_min_distance_from_target[source]
+    }
 
     while unvisited_nodes:
         # Step 2: Move to unvisited node with smallest estimated distance
         # between source and target
         _, current = heapq.heappop(unvisited_nodes)
+        if current in visited_nodes:
+            # Outdated entry, node has already been visited with shorter distance
+            continue
+        visited_nodes.add(current)
 
         # Stop if target has been visited
         if current == target:
@@ -89,12 +106,18 @@ def a_star_search_algorithm(
         # Step 3: Update distance for neighboring unvisited nodes, if smaller
         distance_source_to_current = node_to_min_distance_from_source[current]
         for neighbor, distance_current_to_neighbor in graph.iterate_neighbors(current):
+            if neighbor in visited_nodes:
+                continue
             distance_source_to_neighbor = distance_source_to_current + distance_current_to_neighbor
-            if distance_source_to_neighbor < node_to_min_distance_from_source[neighbor]:
+            if distance_source_to_neighbor < node_to_min_distance_from_source.get(neighbor, math.inf):
                 node_to_min_previous_node[neighbor] = current
                 node_to_min_distance_from_source[neighbor] = distance_source_to_neighbor
+                if neighbor not in node_to_guess_min_distance_from_target:
+                    node_to_guess_min_distance_from_target[neighbor] = guess_min_distance_from_target(
+                        graph, neighbor, target
+                    )
                 node_to_min_distance_from_source_to_target[neighbor] = (
-                    distance_source_to_neighbor + guess_min_distance_from_target(graph, neighbor, target)
+                    distance_source_to_neighbor + node_to_guess_min_distance_from_target[neighbor]
                 )
                 heapq.heappush(
                     unvisited_nodes,
@@ -104,10 +127,110 @@ def a_star_search_algorithm(
     assert current == target, "Source and target are not connected"
 
     # Step 4: Recover shortest path and distance
+    # The path is recovered backwards, so it is reversed once at the end
+    # (cheaper than repeatedly inserting at the beginning)
     shortest_path = [target]
     current = target
     while current in node_to_min_previous_node:
         current = node_to_min_previous_node[current]
-        shortest_path.insert(0, current)
+        shortest_path.append(current)
+    shortest_path.reverse()
     shortest_distance = node_to_min_distance_from_source[target]
     return PathAndDistance(shortest_path, shortest_distance)
+
+
+def a_star_search_algorithm_compiled(
+    graph: graphs.Graph,
+    source: graphs.ValueType,
+    target: graphs.ValueType,
+    guess_min_distance_from_target: Callable[
+        [graphs.Graph, graphs.ValueType, graphs.ValueType], graphs.WeightType
+    ] = no_guess_min_distance_from_target,
+) -> PathAndDistance:
+    """A* search algorithm, compiled to native code with Numba.
+
+    Same logic as `a_star_search_algorithm`, but operating on integer node
+    indices and plain arrays, which Numba can compile:
+    - The graph is converted to Compressed Sparse Row (CSR) format, where the
+      neighbors of node i are `indices[indptr[i]:indptr[i + 1]]`, with the
+      corresponding edge weights in `weights`.
+    - The heuristic is precomputed for all nodes in Python, since it is an
+      arbitrary Python function.
+
+    Without Numba, the same code runs as plain Python.
+
+    Complexity
+    ----------
+    Time: O[(E + V) log V]
+    Space: O(V + E), due to conversion to CSR
+    """
+    values = graph.values
+    value_to_index = {value: index for index, value in enumerate(values)}
+    indptr, indices, weights = _convert_to_csr(graph, value_to_index)
+    guesses = np.array([guess_min_distance_from_target(graph, value, target) for value in values], dtype=np.float64)
+
+    index_target = value_to_index[target]
+    index_to_min_previous_index, index_to_min_distance_from_source = _a_star_search_algorithm_csr(
+        indptr, indices, weights, value_to_index[source], index_target, guesses
+    )
+    assert index_to_min_distance_from_source[index_target] < math.inf, "Source and target are not connected"
+
+    # Recover shortest path and distance
+    shortest_path = [target]
+    index_current = index_target
+    while index_to_min_previous_index[index_current] >= 0:
+        index_current = index_to_min_previous_index[index_current]
+        shortest_path.append(values[index_current])
+    shortest_path.reverse()
+    shortest_distance = float(index_to_min_distance_from_source[index_target])
+    return PathAndDistance(shortest_path, shortest_distance)
+
+
+def _convert_to_csr(
+    graph: graphs.Graph, value_to_index: dict[graphs.ValueType, int]
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    indptr = np.zeros(len(graph) + 1, dtype=np.int64)
+    indices = []
+    weights = []
+    for index, value in enumerate(graph.values):
+        for neighbor, weight in graph.iterate_neighbors(value):
+            indices.append(value_to_index[neighbor])
+            weights.append(weight)
+        indptr[index + 1] = len(indices)
+    return indptr, np.array(indices, dtype=np.int64), np.array(weights, dtype=np.float64)
+
+
+@njit(cache=True)
+def _a_star_search_algorithm_csr(
+    indptr: np.ndarray, indices: np.ndarray, weights: np.ndarray, source: int, target: int, guesses: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    num_nodes = indptr.shape[0] - 1
+    # Used to reconstruct the final path (-1 for no previous node)
+    index_to_min_previous_index = np.full(num_nodes, -1, dtype=np.int64)
+    # g-score: computed min distance of a node from the source
+    index_to_min_distance_from_source = np.full(num_nodes, np.inf)
+    index_to_min_distance_from_source[source] = 0.0
+    is_visited = np.zeros(num_nodes, dtype=np.bool_)
+    # Min-priority queue of (f-score, node) pairs
+    unvisited_nodes = [(guesses[source], source)]
+
+    while len(unvisited_nodes) > 0:
+        _, current = heapq.heappop(unvisited_nodes)
+        if is_visited[current]:
+            continue
+        is_visited[current] = True
+        if current == target:
+            break
+
+        distance_source_to_current = index_to_min_distance_from_source[current]
+        for position in range(indptr[current], indptr[current + 1]):
+            neighbor = indices[position]
+            if is_visited[neighbor]:
+                continue
+            distance_source_to_neighbor = distance_source_to_current + weights[position]
+            if distance_source_to_neighbor < index_to_min_distance_from_source[neighbor]:
+                index_to_min_previous_index[neighbor] = current
+                index_to_min_distance_from_source[neighbor] = distance_source_to_neighbor
+                heapq.heappush(unvisited_nodes, (distance_source_to_neighbor + guesses[neighbor], neighbor))
+
+    return index_to_min_previous_index, index_to_min_distance_from_source
@@ -1,15 +1,51 @@
-"""A selection of well-known sorting algorithms."""
+"""A selection of well-known sorting algorithms.
+
+The individual algorithms are meant for studying. For actual use, `sort` relies
+on the built-in Timsort, implemented in C, which is faster than any of them.
+"""
 
 from __future__ import annotations
 
+import copy
 import heapq
-from typing import Protocol, TypeVar
+from array import ArrayType
+from typing import Callable, Protocol, TypeVar
+
+import numpy as np
+
+from dsa._jit import HAS_NUMBA
+from dsa.algorithms import _sorting_numba
+from dsa.algorithms._sorting_numba import MERGE_SORT_CUTOFF, NINTHER_MIN_SIZE, QUICKSORT_CUTOFF
+
+__all__ = [
+    "SortingAlgorithm",
+    "bubble_sort",
+    "gpu_sort",
+    "heap_sort",
+    "insertion_sort",
+    "merge_sort_bottom_up",
+    "merge_sort_top_down",
+    "quicksort_hoare",
+    "quicksort_lomuto",
+    "radix_sort",
+    "selection_sort",
+    "sort",
+]
 
 ValueType = TypeVar("ValueType")
 
+# Inputs shorter than that are sorted by insertion sort alone, as a single run
+MIN_RUN_MAX = 64
+# Element type of the compiled kernels, for each kind of NumPy array
+_KIND_TO_KERNEL_DTYPE = {"i": np.int64, "u": np.int64, "f": np.float64}
+
 
 class SortingAlgorithm(Protocol):
-    """Place elements in the given list in ascending order."""
+    """Place elements in the given list in ascending order.
+
+    NumPy arrays and `array.array` objects are accepted too. Numeric arrays
+    can then be sorted by compiled kernels, without boxing every element.
+    """
 
     def __call__(self, array: list[ValueType]) -> list[ValueType]:
         pass
@@ -20,13 +56,15 @@ def bubble_sort(array: list[ValueType]) -> list[ValueType]:
 
     Adjacent elements are repeatedly swapped if they are in the wrong order.
     Large elements bubble up towards the end of the array, hence the name of
-    the algorithm.
+    the algorithm. After each pass, the largest unsorted element has reached its
+    final position, and if a pass performs no swaps, the array is sorted.
 
     Pros
     ----------
     - Simple
     - Stable
     - Low memory
+    - Fast for nearly-sorted input
 
     Cons
     ----
@@ -37,19 +75,73 @@ def bubble_sort(array: list[ValueType]) -> list[ValueType]:
     Time: O(N**2)
     Space: O(1)
     """
+    if _sort_compiled(array, _sorting_numba.bubble_sort_compiled):
+        return array
+
     # Progressively sort elements
-    for _ in range(len(array)):
+    size = len(array)
+    for size_sorted in range(size - 1):
         # Go through unsorted array and put adjacent elements in order
-        for index_bubble in range(len(array) - 1):
+        swapped = False
+        for index_bubble in range(size - 1 - size_sorted):
             if array[index_bubble] > array[index_bubble + 1]:
-                _swap_elements(array, index_bubble, index_bubble + 1)
+                array[index_bubble], array[index_bubble + 1] = array[index_bubble + 1], array[index_bubble]
+                swapped = True
+        if not swapped:
+            # Nothing was out of order
+            break
+    return array
+
+
+def gpu_sort(array: list[ValueType]) -> list[ValueType]:
+    """Sort numeric array on the GPU with CuPy.
+
+    CuPy sorts with the radix sort of CUB/Thrust, which processes all elements
+    in parallel and is bound by the memory bandwidth of the GPU. When CuPy is
+    not installed, NumPy sorts the array on the CPU instead.
+
+    Pros
+    ----
+    - Very fast for large input
+
+    Cons
+    ----
+    - Only for numeric arrays
+    - Requires a GPU
+    - Slow for small input, due to data transfers
+
+    Complexity
+    ----------
+    Time: O(N log N), or O(N x K) for the radix sort on the GPU, where K is the number of bytes per element
+    Space: O(N)
+
+    Copying the array to the GPU and back costs a floor of about 100 microseconds,
+    whatever its size, so the GPU only beats the CPU from roughly 10**5 elements on.
+    """
+    if len(array) == 0:
+        return array
+    # NumPy arrays of any numeric type can be sorted by CuPy as they are
+    is_numeric_ndarray = isinstance(array, np.ndarray) and array.dtype.kind in "iuf"
+    values = array if is_numeric_ndarray else _to_buffer(array)
+    if values is None:
+        raise TypeError("GPU sort only applies to numeric arrays")
+    try:
+        import cupy
+    except ImportError:
+        values.sort()
+    else:
+        values_on_device = cupy.asarray(values)
+        values_on_device.sort()
+        values[:] = cupy.asnumpy(values_on_device)
+    _copy_back_from_buffer(array, values)
     return array
 
 
 def heap_sort(array: list[ValueType]) -> list[ValueType]:
     """Sorting based on the heap data structure.
 
-    Constructs a min heap, and iteratively extracts smallest element.
+    Constructs a min heap, and iteratively extracts smallest element. The heap
+    is built bottom-up in linear time, instead of pushing elements one-by-one.
 
     Pros
     ----
@@ -64,14 +156,20 @@ def heap_sort(array: list[ValueType]) -> list[ValueType]:
     Complexity
     ----------
     Time: O(N log N)
-    Space: O(1)
+    Space: O(N)
     """
+    _heap_sort_range(array, index_left=0, index_right=len(array))
+    return array
+
+
+def _heap_sort_range(array: list[ValueType], index_left: int, index_right: int) -> None:
+    """Sort subarray [index_left, index_right) with heap sort."""
     # Construct heap (TODO: Use custom implementation)
-    heap = []
-    for _ in range(len(array)):
-        heapq.heappush(heap, array.pop())
+    heap = list(array[index_left:index_right])
+    heapq.heapify(heap)
     # Successively extract minimum elements
-    return [heapq.heappop(heap) for _ in range(len(heap))]
+    for index in range(index_left, index_right):
+        array[index] = heapq.heappop(heap)
 
 
 def insertion_sort(array: list[ValueType]) -> list[ValueType]:
@@ -99,24 +197,34 @@ def insertion_sort(array: list[ValueType]) -> list[ValueType]:
     Time: O(N**2)
     Space: O(1)
     """
-    # Loop over all elements that need to be sorted one-by-one
-    for index_to_be_sorted in range(1, len(array)):
-        # Move element to the left, until it has been sorted
-        for index in range(index_to_be_sorted, 0, -1):
-            if array[index - 1] > array[index]:
-                # Move element one step to the left
-                _swap_elements(array, index, index - 1)
-            else:
-                # Element has been sorted
-                break
+    if _sort_compiled(array, _sorting_numba.insertion_sort_compiled):
+        return array
+
+    _insertion_sort_range(array, index_left=0, index_right=len(array))
     return array
 
 
+def _insertion_sort_range(array: list[ValueType], index_left: int, index_right: int) -> None:
+    """Insertion sort applied on subarray [index_left, index_right)."""
+    # Loop over all elements that need to be sorted one-by-one
+    for index_to_be_sorted in range(index_left + 1, index_right):
+        value = array[index_to_be_sorted]
+        # Shift larger elements one step to the right, until the position of the
+        # element is found. Keeping the element aside avoids swapping it along.
+        index = index_to_be_sorted
+        while index > index_left and array[index - 1] > value:
+            array[index] = array[index - 1]
+            index -= 1
+        array[index] = value
+
+
 def merge_sort_top_down(array: list[ValueType]) -> list[ValueType]:
     """An efficient top-down, divide-and-conquer algorithm.
 
     Recursively divide input into subarrays, sort them, and merge them back.
-    Requires a single buffer array, which gets efficiently copied.
+    Requires a single buffer array, which gets efficiently copied. Small
+    subarrays are sorted with insertion sort, which saves the deepest levels
+    of recursion.
 
     Pros
     ----
@@ -133,12 +241,17 @@ def merge_sort_top_down(array: list[ValueType]) -> list[ValueType]:
     Time: O(N log N)
     Space: O(N)
     """
+    if _sort_compiled(array, _sorting_numba.merge_sort_top_down_compiled, numpy_kind="stable"):
+        return array
+
     source = array
-    target = array.copy()
+    target = copy.copy(array)
 
     def mergesort(source: list[ValueType], target: list[ValueType], index_left: int, index_right: int) -> None:
-        if index_right - index_left <= 1:
-            # No more splitting possible
+        if index_right - index_left <= MERGE_SORT_CUTOFF:
+            # Not worth splitting any further. Source and target still hold the
+            # same values here, so sorting the target alone is enough.
+            _insertion_sort_range(target, index_left, index_right)
             return
 
         # Split in half
@@ -181,41 +294,164 @@ def merge_sort_bottom_up(array: list[ValueType]) -> list[ValueType]:
     """An efficient bottom-up, divide-and-conquer algorithm.
 
     Similar to the top-down approach, but without recursion for the division
-    step. Instead, it already considers the source array divided into single-
-    element arrays, and only performs the merge.
+    step. Instead, it considers the source array already divided into sorted
+    subarrays, and only performs the merge.
+
+    Like Timsort, the subarrays are the runs that are already in order in the
+    input (descending runs get reversed). Short runs are extended with
+    insertion sort to a minimum length between 32 and 64, picked so that the
+    number of runs is close to a power of two. Runs are pushed onto a stack,
+    and merged until the lengths of the top three X, Y, Z satisfy X > Y + Z and
+    Y > Z, which keeps merges balanced.
+
+    The compiled version used for numeric input does not detect runs. It
+    merges fixed-width subarrays, level by level, as in the textbook version.
+
+    Pros
+    ----
+    + Stable
+    + Guaranteed O(N log N) complexity
+    + Very fast for nearly-sorted input
+
+    Cons
+    ----
+    - High memory
+
+    Complexity
+    ----------
+    Time: O(N log N)
+    Space: O(N)
     """
-    source = array
-    target = array.copy()
-    total_size = len(target)
+    if _sort_compiled(array, _sorting_numba.merge_sort_bottom_up_compiled, numpy_kind="stable"):
+        return array
+
+    total_size = len(array)
+    min_run = _get_min_run(total_size)
+    # Stack of consecutive sorted runs, each given by its [index_left, index_right)
+    runs: list[tuple[int, int]] = []
+    index_left = 0
+    while index_left < total_size:
+        index_right = _find_end_of_run(array, index_left)
+        if index_right - index_left < min_run:
+            # Too short to be worth merging
+            index_right = min(index_left + min_run, total_size)
+            _insertion_sort_range(array, index_left, index_right)
+        runs.append((index_left, index_right))
+        _merge_collapse(array, runs)
+        index_left = index_right
+
+    # Merge remaining runs, whose lengths are decreasing geometrically
+    while len(runs) >= 2:
+        _merge_runs_at(array, runs, len(runs) - 2)
+    return array
 
-    # Iteratively merge divided arrays at different scales
-    width = 1
-    while width < total_size:
-        # This swapping is an optimization: At each merge, the target contains
-        # the sorted subarray, which is then used as the source in the next pass
-        # This back-and-forth merging avoids unnecessary copying.
-        source, target = target, source
 
-        # Iteratively sort and merge fixed-width arrays
-        for index_left in range(0, total_size, 2 * width):
-            index_middle = min(index_left + width, total_size)
-            index_right = min(index_left + 2 * width, total_size)
-            _sort_and_merge(source, target, index_left, index_middle, index_right)
+def _get_min_run(size: int) -> int:
+    """Return minimum run length, so that size / min_run is a power of two, or slightly less.
 
-        width *= 2
+    Take the 6 most significant bits of size, plus one if any of the remaining
+    bits is set. Merges are then balanced, for random input.
+    """
+    any_bit_shifted_out = 0
+    while size >= MIN_RUN_MAX:
+        any_bit_shifted_out |= size & 1
+        size >>= 1
+    return size + any_bit_shifted_out
 
-    return target
+
+def _merge_collapse(array: list[ValueType], runs: list[tuple[int, int]]) -> None:
+    """Merge runs on top of the stack, until their lengths satisfy Timsort's invariants.
+
+    For the lengths X, Y, Z of the top three runs, X > Y + Z and Y > Z. Checking
+    the invariant one level deeper as well keeps it valid for the whole stack.
+    Lengths then grow at least as fast as the Fibonacci numbers from the top
+    down, so the stack stays logarithmically small.
+    """
+    while len(runs) >= 2:
+        index_run = len(runs) - 2
+        size_y = _get_run_size(runs[index_run])
+        size_z = _get_run_size(runs[index_run + 1])
+        if (index_run >= 1 and _get_run_size(runs[index_run - 1]) <= size_y + size_z) or (
+            index_run >= 2 and _get_run_size(runs[index_run - 2]) <= _get_run_size(runs[index_run - 1]) + size_y
+        ):
+            # Merge Y with the shorter of its neighbors
+            if _get_run_size(runs[index_run - 1]) < size_z:
+                index_run -= 1
+        elif size_y > size_z:
+            return
+        _merge_runs_at(array, runs, index_run)
+
+
+def _find_end_of_run(array: list[ValueType], index_left: int) -> int:
+    """Return end of run starting at index_left, after putting it in ascending order.
+
+    Descending runs must be strictly descending, so that reversing them does
+    not reorder equal elements, and the sort remains stable.
+    """
+    size = len(array)
+    index_right = index_left + 1
+    if index_right == size:
+        return index_right
+    if array[index_right] < array[index_left]:
+        while index_right < size and array[index_right] < array[index_right - 1]:
+            index_right += 1
+        array[index_left:index_right] = array[index_left:index_right][::-1]
+    else:
+        while index_right < size and array[index_right] >= array[index_right - 1]:
+            index_right += 1
+    return index_right
+
+
+def _get_run_size(run: tuple[int, int]) -> int:
+    index_left, index_right = run
+    return index_right - index_left
+
+
+def _merge_runs_at(array: list[ValueType], runs: list[tuple[int, int]], index_run: int) -> None:
+    """Merge the runs at index_run and index_run + 1 of the stack into one, in place.
+
+    Only the left run is copied out. The merged output is then written from the
+    start of the left run, and can never overtake the elements of the right run
+    that are still to be read.
+    """
+    index_left, index_middle = runs[index_run]
+    _, index_right = runs.pop(index_run + 1)
+    run_left = list(array[index_left:index_middle])
+    index_sub_left = 0
+    index_sub_right = index_middle
+    index_target = index_left
+    while index_sub_left < len(run_left) and index_sub_right < index_right:
+        if run_left[index_sub_left] <= array[index_sub_right]:  # The equality makes it stable
+            array[index_target] = run_left[index_sub_left]
+            index_sub_left += 1
+        else:
+            array[index_target] = array[index_sub_right]
+            index_sub_right += 1
+        index_target += 1
+    # Leftovers of the right run are already in place. Those of the left one are
+    # written one by one, since the array may not accept a list slice.
+    for value in run_left[index_sub_left:]:
+        array[index_target] = value
+        index_target += 1
+    runs[index_run] = (index_left, index_right)
 
 
 def quicksort_lomuto(array: list[ValueType]) -> list[ValueType]:
     """Efficient, general purpose algorithm based on Lomuto partitioning scheme.
 
     The algorithm consists of recursively performing the following steps:
-    1. Select the last element of the array as pivot.
+    1. Select the median of the first, middle and last elements as pivot.
     2. Partition the array, so that all smaller and larger elements are placed
     on the left and right of the pivot, respectively.
     3. Repeat 1-2 for the two partitioned arrays
 
+    Picking the median of three, instead of a fixed element, avoids the worst
+    case on already sorted or reverse-sorted input. For large subarrays, the
+    median of three medians of three (ninther) is picked instead. Small subarrays are sorted
+    with insertion sort, which is faster there than further partitioning. If
+    subarrays keep getting split unevenly, they are sorted with heap sort
+    instead (introsort), which bounds the worst case to O(N log N).
+
     Pros
     ----
     - Cache friendly (in-place)
@@ -224,85 +460,216 @@ def quicksort_lomuto(array: list[ValueType]) -> list[ValueType]:
     Cons
     ----
     - Not stable
-    - Poor worst-case performance
 
     Complexity
     ----------
-    Time: O(N**2)
-    Space: O(N)
+    Time: O(N log N)
+    Space: O(log N)
     """
+    if _sort_compiled(array, _sorting_numba.quicksort_lomuto_compiled):
+        return array
 
-    def quicksort(index_left: int, index_right: int) -> None:
-        if index_right - index_left <= 1:
-            # No more splitting
-            return
-        index_pivot = _partition_and_return_pivot_index_lomuto(array, index_left, index_right)
-        quicksort(index_left, index_pivot)
-        quicksort(index_pivot + 1, index_right)
-
-    quicksort(index_left=0, index_right=len(array))
+    _quicksort_lomuto_impl(array, index_left=0, index_right=len(array))
     return array
 
 
-def _partition_and_return_pivot_index_lomuto(array: list[ValueType], index_left: int, index_right: int) -> int:
-    """Select last element as pivot, partition array, and return pivot index.
+def _quicksort_lomuto_impl(array: list[ValueType], index_left: int, index_right: int) -> None:
+    """Sort subarray [index_left, index_right) with Lomuto partitioning.
 
-    By default, the pivot point will be placed at the beginning of the array.
-    Each time a smaller element is encountered, it is moved to the left of the
-    pivot, so the index of the latter gets incremented by one.
+    Partitioning is written inline, instead of in a separate function, which
+    saves a function call per partition.
     """
-    value_pivot = array[index_right - 1]
-    index_pivot = index_left
-    for index in range(index_left, index_right - 1):
-        if array[index] <= value_pivot:
-            # Move element to the left of pivot.
-            _swap_elements(array, index_pivot, index)
-            index_pivot += 1
-    # Move pivot after smaller element, and return its index.
-    _swap_elements(array, index_pivot, index_right - 1)
-    return index_pivot
+    # Subarrays still to be sorted, along with how many more times they can be
+    # split. Instead of recursing, the larger partition is pushed, and the
+    # smaller one is split right away, so that the stack stays logarithmic.
+    stack = [(index_left, index_right, _get_depth_limit(index_right - index_left))]
+    while stack:
+        index_left, index_right, depth_left = stack.pop()
+        while index_right - index_left > QUICKSORT_CUTOFF:
+            if depth_left == 0:
+                # Pivots have been poor too many times, so switch to a
+                # guaranteed O(N log N) algorithm (introsort)
+                _heap_sort_range(array, index_left, index_right)
+                index_left = index_right
+                break
+            depth_left -= 1
+            # Select pivot, and move it to the end. By default,
+            # the pivot point will be placed at the beginning of the array. Each
+            # time a smaller element is encountered, it is moved to the left of the
+            # pivot, so the index of the latter gets incremented by one.
+            index_median = _select_pivot(array, index_left, index_right)
+            array[index_median], array[index_right - 1] = array[index_right - 1], array[index_median]
+            value_pivot = array[index_right - 1]
+            index_pivot = index_left
+            for index in range(index_left, index_right - 1):
+                if array[index] <= value_pivot:
+                    # Move element to the left of pivot. Swapping an element with
+                    # itself is harmless, and cheaper than checking for it.
+                    array[index_pivot], array[index] = array[index], array[index_pivot]
+                    index_pivot += 1
+            # Move pivot after smaller elements
+            array[index_pivot], array[index_right - 1] = array[index_right - 1], array[index_pivot]
+
+            if index_pivot - index_left < index_right - index_pivot:
+                stack.append((index_pivot + 1, index_right, depth_left))
+                index_right = index_pivot
+            else:
+                stack.append((index_left, index_pivot, depth_left))
+                index_left = index_pivot + 1
+        # Not worth splitting any further
+        _insertion_sort_range(array, index_left, index_right)
 
 
 def quicksort_hoare(array: list[ValueType]) -> list[ValueType]:
     """Efficient, general purpose algorithm based on Hoare partitioning scheme.
 
-    Similar to Lomuto, but selecting the first element of the array as pivot,
+    Similar to Lomuto, but the median of three is moved to the beginning of the
+    array, instead of the end. Partitioning makes fewer swaps than Lomuto.
     """
+    if _sort_compiled(array, _sorting_numba.quicksort_hoare_compiled):
+        return array
 
-    def quicksort(index_left: int, index_right: int) -> None:
-        if index_right - index_left <= 1:
-            # No more splitting
-            return
-        index_pivot = _partition_and_return_pivot_index_hoare(array, index_left, index_right)
-        quicksort(index_left, index_pivot)
-        quicksort(index_pivot + 1, index_right)
-
-    quicksort(index_left=0, index_right=len(array))
+    _quicksort_hoare_impl(array, index_left=0, index_right=len(array))
     return array
 
 
-def _partition_and_return_pivot_index_hoare(array: list[ValueType], index_left: int, index_right: int) -> int:
-    """Select first element as pivot, partition array, and return pivot index.
+def _quicksort_hoare_impl(array: list[ValueType], index_left: int, index_right: int) -> None:
+    """Sort subarray [index_left, index_right) with Hoare partitioning.
 
-    Successively swap elements between the left and right side of the pivot,
-    starting from the ends and moving towards the middle, until they are all
-    ordered with respect to the pivot.
+    Partitioning is written inline, as for Lomuto.
     """
-    value_pivot = array[index_left]
-    index_sub_left = index_left
-    index_sub_right = index_right - 1
-    while True:
-        while array[index_sub_left] < value_pivot:
-            # Loop over left subarray, until an unordered element is found
-            index_sub_left += 1
-        while array[index_sub_right] > value_pivot:
-            # Loop over right subarray, until an unordered element is found
-            index_sub_right -= 1
-        if index_sub_left >= index_sub_right:
-            # Partitioning has finished
-            return index_sub_right
-        # Reorder elements
-        _swap_elements(array, index_sub_left, index_sub_right)
+    # Subarrays still to be sorted, with the larger partition pushed
+    stack = [(index_left, index_right, _get_depth_limit(index_right - index_left))]
+    while stack:
+        index_left, index_right, depth_left = stack.pop()
+        while index_right - index_left > QUICKSORT_CUTOFF:
+            if depth_left == 0:
+                # Fall back to heap sort (introsort)
+                _heap_sort_range(array, index_left, index_right)
+                index_left = index_right
+                break
+            depth_left -= 1
+            # Select pivot, and move it to the beginning. Then,
+            # successively swap elements between the left and right side of the
+            # pivot, starting from the ends and moving towards the middle, until
+            # they are all ordered with respect to the pivot. Elements up to and
+            # including the split index are no larger than the pivot, and the rest
+            # are no smaller. Unlike Lomuto, the pivot does not necessarily end up
+            # at the split index.
+            index_median = _select_pivot(array, index_left, index_right)
+            array[index_median], array[index_left] = array[index_left], array[index_median]
+            value_pivot = array[index_left]
+            index_sub_left = index_left
+            index_sub_right = index_right - 1
+            while True:
+                while array[index_sub_left] < value_pivot:
+                    # Loop over left subarray, until an unordered element is found
+                    index_sub_left += 1
+                while array[index_sub_right] > value_pivot:
+                    # Loop over right subarray, until an unordered element is found
+                    index_sub_right -= 1
+                if index_sub_left >= index_sub_right:
+                    # Partitioning has finished
+                    break
+                # Reorder elements, and move past them. Otherwise, elements equal to
+                # the pivot would be swapped forever.
+                array[index_sub_left], array[index_sub_right] = array[index_sub_right], array[index_sub_left]
+                index_sub_left += 1
+                index_sub_right -= 1
+            index_split = index_sub_right
+
+            if index_split + 1 - index_left < index_right - index_split - 1:
+                stack.append((index_split + 1, index_right, depth_left))
+                index_right = index_split + 1
+            else:
+                stack.append((index_left, index_split + 1, depth_left))
+                index_left = index_split + 1
+        # Not worth splitting any further
+        _insertion_sort_range(array, index_left, index_right)
+
+
+def _get_depth_limit(size: int) -> int:
+    """Return how many times a subarray can be split, before quicksort falls back to heap sort.
+
+    Balanced splits only need log2(size) levels, so twice as many means that
+    pivots have been consistently poor.
+    """
+    return 2 * size.bit_length()
+
+
+def _select_pivot(array: list[ValueType], index_left: int, index_right: int) -> int:
+    """Return the index of a pivot for subarray [index_left, index_right).
+
+    Small subarrays use the median of the first, middle and last elements. Large
+    ones use the median of three such medians, spread over the subarray
+    (Tukey's ninther), which is much more likely to be close to the true median.
+    """
+    index_middle = (index_left + index_right) // 2
+    index_last = index_right - 1
+    if index_right - index_left <= NINTHER_MIN_SIZE:
+        return _median_of_three(array, index_left, index_middle, index_last)
+    step = (index_right - index_left) // 8
+    return _median_of_three(
+        array,
+        _median_of_three(array, index_left, index_left + step, index_left + 2 * step),
+        _median_of_three(array, index_middle - step, index_middle, index_middle + step),
+        _median_of_three(array, index_last - 2 * step, index_last - step, index_last),
+    )
+
+
+def _median_of_three(array: list[ValueType], index_1: int, index_2: int, index_3: int) -> int:
+    """Return the index of the median value among the three given indices."""
+    if array[index_1] > array[index_2]:
+        index_1, index_2 = index_2, index_1
+    if array[index_2] > array[index_3]:
+        index_2, index_3 = index_3, index_2
+        if array[index_1] > array[index_2]:
+            index_1, index_2 = index_2, index_1
+    return index_2
+
+
+def radix_sort(array: list[int]) -> list[int]:
+    """Non-comparison sort for integers, processing one byte at a time.
+
+    Least significant digit (LSD) radix sort: the array is repeatedly sorted by
+    a single byte of its elements, starting from the least significant one.
+    Each pass is a stable counting sort, so elements sharing the same byte keep
+    their order from the previous passes. All passes are vectorized with NumPy.
+    Negative integers are handled by offsetting all elements by the minimum.
+
+    Pros
+    ----
+    - Stable
+    - No comparisons
+    - Linear for integers within a bounded range
+
+    Cons
+    ----
+    - Only for integers that fit in 64 bits
+    - High memory
+
+    Complexity
+    ----------
+    Time: O(N x K), where K is the number of bytes needed for max - min
+    Space: O(N)
+    """
+    if len(array) == 0:
+        return array
+    values = np.asarray(array)
+    if values.dtype.kind not in "iu":
+        raise TypeError("Radix sort only applies to integers that fit in 64 bits")
+
+    # Unsigned arithmetic wraps around, so the offsets are exact even when the
+    # range of values exceeds the signed 64-bit one.
+    value_min = values.min().astype(np.uint64)
+    keys = values.astype(np.uint64) - value_min
+    num_bytes = (int(keys.max()).bit_length() + 7) // 8
+    for index_byte in range(num_bytes):
+        digits = ((keys >> np.uint64(8 * index_byte)) & np.uint64(0xFF)).astype(np.uint8)
+        # NumPy sorts small integers with a stable counting sort
+        keys = keys[np.argsort(digits, kind="stable")]
+    _copy_back_from_buffer(array, (keys + value_min).astype(values.dtype))
+    return array
 
 
 def selection_sort(array: list[ValueType]) -> list[ValueType]:
@@ -326,19 +693,114 @@ def selection_sort(array: list[ValueType]) -> list[ValueType]:
     Time: O(N**2)
     Space: O(1)
     """
+    if _sort_compiled(array, _sorting_numba.selection_sort_compiled):
+        return array
+
     # Progressively construct sorted portion
-    for size_sorted in range(len(array) - 1):
+    size = len(array)
+    for size_sorted in range(size - 1):
         # Select smallest element in unsorted portion
         index_min = size_sorted
-        for index in range(size_sorted + 1, len(array)):
+        for index in range(size_sorted + 1, size):
             if array[index] < array[index_min]:
                 index_min = index
         # Move to end of sorted portion
-        _swap_elements(array, size_sorted, index_min)
+        array[size_sorted], array[index_min] = array[index_min], array[size_sorted]
     return array
 
 
-def _swap_elements(array: list[ValueType], index_1: int, index_2: int) -> None:
-    """Helper function to swap array elements in place."""
-    if index_1 != index_2:
-        array[index_1], array[index_2] = array[index_2], array[index_1]
+def sort(array: list[ValueType]) -> list[ValueType]:
+    """Default sorting algorithm, recommended over all others in this module.
+
+    Lists are sorted by the built-in Timsort, and NumPy arrays by NumPy's own
+    stable sort, both implemented in C.
+
+    Pros
+    ----
+    - Stable
+    - Very fast for nearly-sorted input
+    - Guaranteed O(N log N) complexity
+
+    Cons
+    ----
+    - Not educational
+
+    Complexity
+    ----------
+    Time: O(N log N)
+    Space: O(N)
+    """
+    if isinstance(array, list):
+        array.sort()
+    elif isinstance(array, np.ndarray):
+        array.sort(kind="stable")
+    elif isinstance(array, ArrayType):
+        array[:] = ArrayType(array.typecode, sorted(array))
+    else:
+        array[:] = sorted(array)
+    return array
+
+
+def _sort_compiled(array: list[ValueType], kernel: Callable[[np.ndarray], None], numpy_kind: str | None = None) -> bool:
+    """Sort numeric array in place with a compiled kernel, if possible.
+
+    Without Numba, falls back to NumPy's own sort of the given kind, if any.
+    Returns whether the array has been sorted.
+    """
+    if not HAS_NUMBA and numpy_kind is None:
+        return False
+    values = _to_buffer(array)
+    if values is None:
+        return False
+    if HAS_NUMBA:
+        kernel(values)
+    else:
+        values.sort(kind=numpy_kind)
+    _copy_back_from_buffer(array, values)
+    return True
+
+
+def _to_buffer(array: list[ValueType]) -> np.ndarray | None:
+    """Return elements of numeric array as a contiguous 64-bit NumPy array.
+
+    Lists store a pointer to a separately allocated object per element, while
+    NumPy arrays store the raw values next to each other, which is far more
+    cache friendly. NumPy arrays and `array.array` objects of 64-bit integers
+    or floats are used as they are, without copying. Other numeric arrays, and
+    lists made up entirely of integers or entirely of floats, are copied.
+
+    The compiled kernels are specialized for int64 and float64 elements, and
+    the kind of the elements decides which of the two gets used. Returns None
+    for arrays that fit neither, so that they get sorted in Python instead.
+    """
+    if len(array) == 0:
+        return None
+    if isinstance(array, (np.ndarray, ArrayType)):
+        # Both expose their memory with the element type, so there is no copying
+        values = np.asarray(array)
+    elif isinstance(array, list):
+        value_type = type(array[0])
+        if value_type not in (int, float) or any(type(value) is not value_type for value in array):
+            return None
+        values = np.array(array)
+    else:
+        return None
+
+    dtype_kernel = _KIND_TO_KERNEL_DTYPE.get(values.dtype.kind)
+    if dtype_kernel is None or values.ndim != 1 or values.dtype.itemsize > 8:
+        return None
+    if values.dtype.kind == "u" and values.dtype.itemsize == 8:
+        # Might not fit in signed 64 bits
+        return None
+    return np.ascontiguousarray(values, dtype=dtype_kernel)
+
+
+def _copy_back_from_buffer(array: list[ValueType], values: np.ndarray) -> None:
+    """Copy sorted buffer back into the array, unless they share memory."""
+    if isinstance(array, list):
+        array[:] = values.tolist()
+    elif isinstance(array, ArrayType):
+        if not np.may_share_memory(values, array):
+            array[:] = ArrayType(array.typecode, values.tolist())
+    elif not np.may_share_memory(values, array):
+        array[:] = values
@@ -4,8 +4,13 @@ import itertools
 import math
 from typing import Protocol
 
+import numpy as np
+
 from dsa.data_structures import graphs
 
+# Number of paths whose distances get computed at once, by the brute force approach
+PATHS_PER_CHUNK = 2**12
+
 
 class TravelingSalesmanAlgorithm(Protocol):
     """Solution to the Traveling Salesman Problem (TSP).
@@ -27,28 +32,47 @@ def traveling_salesman_brute_force(graph: graphs.Graph) -> tuple[list[graphs.Val
     Consider all possible paths, and compute the corresponding distance. Select
     and return path with smallest total distance.
 
+    Since all rotations of a path have the same distance, paths always start
+    from the first city. Their distances are computed with NumPy, a chunk of
+    paths at a time, by gathering consecutive pairs from a distance matrix.
+
     Complexity
     ----------
     Time: O(N!)
     Space: O(N)
     """
+    cities_all = graph.values
+    num_cities = len(cities_all)
+    if num_cities <= 1:
+        # No connection to go through
+        return cities_all + cities_all, 0.0 if cities_all else math.inf
+    distances = _get_distance_matrix(graph)
 
     distance_min = math.inf
     path_min: list[graphs.ValueType] = []
 
-    for cities in itertools.permutations(graph.values):
-        # We need to return to starting city
-        cities = list(cities) + [cities[0]]
-
-        # Compute total distance
-        distance = 0.0
-        for city_current, city_next in itertools.pairwise(cities):
-            distance += graph.get_connection_weight(city_current, city_next)
+    # We need to start from and return to first city, whose index is zero. The
+    # same buffer is reused for all chunks.
+    paths = np.zeros((PATHS_PER_CHUNK, num_cities + 1), dtype=np.intp)
+    permutations = itertools.permutations(range(1, num_cities))
+    while True:
+        # Read permutations straight into an array, without building a list of tuples
+        stops = np.fromiter(
+            itertools.islice(permutations, PATHS_PER_CHUNK), dtype=np.dtype((np.intp, (num_cities - 1,)))
+        )
+        if len(stops) == 0:
+            break
+        paths_chunk = paths[: len(stops)]
+        paths_chunk[:, 1:-1] = stops
+
+        # Compute total distances
+        distances_path = distances[paths_chunk[:, :-1], paths_chunk[:, 1:]].sum(axis=1)
 
         # Store if smallest so far
-        if distance < distance_min:
-            distance_min = distance
-            path_min = list(cities)
+        index_min = int(np.argmin(distances_path))
+        if distances_path[index_min] < distance_min:
+            distance_min = float(distances_path[index_min])
+            path_min = [cities_all[index] for index in paths_chunk[index_min].tolist()]
 
     return path_min, distance_min
 
@@ -66,30 +90,40 @@ def traveling_salesman_recursion(graph: graphs.Graph) -> tuple[list[graphs.Value
     Space: O(N)
     """
     cities_all = graph.values
-    city_start = cities_all[0]
+    # Weights are looked up once, instead of going through the graph for every
+    # step. Nested lists are faster than a NumPy array for scalar access.
+    distances = _get_distance_matrix(graph).tolist()
+    # Cities are referred to by index from now on
+    city_start = 0
+
+    # Visited cities are tracked as a bitmask, where bit i is set if city i has
+    # been visited, so that checking a city does not scan the path
+    cities_visited_all = (1 << len(cities_all)) - 1
 
     def compute_min_path_and_distance(
-        city_current: graphs.ValueType, path_covered: list[graphs.ValueType], distance_covered: graphs.WeightType
-    ) -> tuple[list[graphs.ValueType], float]:
-        if len(path_covered) == len(cities_all):
+        city_current: int, cities_visited: int, path_covered: list[int], distance_covered: graphs.WeightType
+    ) -> tuple[list[int], float]:
+        if cities_visited == cities_visited_all:
             # Return to starting city
-            path_covered.append(city_start)
-            distance_covered += graph.get_connection_weight(city_current, city_start)
-            return path_covered, distance_covered
+            return path_covered + [city_start], distance_covered + distances[city_current][city_start]
 
         distance_min = math.inf
-        path_min: list[graphs.ValueType] = []
-        for city_next in cities_all:
+        path_min: list[int] = []
+        for city_next in range(len(cities_all)):
             # Go through all unvisited cities
-            if city_next in path_covered:
+            if cities_visited >> city_next & 1:
                 continue
 
-            # Compute minimum remaining path and distance through that stop
+            # Compute minimum remaining path and distance through that stop. The
+            # path is extended in place, and restored afterwards.
+            path_covered.append(city_next)
             path, distance = compute_min_path_and_distance(
                 city_current=city_next,
-                path_covered=path_covered + [city_next],
-                distance_covered=distance_covered + graph.get_connection_weight(city_current, city_next),
+                cities_visited=cities_visited | 1 << city_next,
+                path_covered=path_covered,
+                distance_covered=distance_covered + distances[city_current][city_next],
             )
+            path_covered.pop()
 
             # Store if smallest so far
             if distance < distance_min:
@@ -98,4 +132,67 @@ def traveling_salesman_recursion(graph: graphs.Graph) -> tuple[list[graphs.Value
 
         return path_min, distance_min
 
-    return compute_min_path_and_distance(city_start, path_covered=[city_start], distance_covered=0.0)
+    path_min, distance_min = compute_min_path_and_distance(
+        city_start, cities_visited=1 << city_start, path_covered=[city_start], distance_covered=0.0
+    )
+    return [cities_all[city] for city in path_min], distance_min
+
+
+def traveling_salesman_dynamic_programming(graph: graphs.Graph) -> tuple[list[graphs.ValueType], graphs.WeightType]:
+    """Dynamic programming approach to the TSP (Held-Karp).
+
+    The shortest way to finish a path only depends on the current city and on
+    the set of cities visited so far, not on the order they were visited in.
+    Such sets are encoded as bitmasks, where bit i is set if city i has been
+    visited. The table of remaining distances is filled from the full set
+    down to the starting city alone, each row at once with NumPy. The path is
+    then rebuilt by following the best next city from the start.
+
+    Complexity
+    ----------
+    Time: O(N**2 x 2**N)
+    Space: O(N x 2**N)
+    """
+    cities_all = graph.values
+    num_cities = len(cities_all)
+    if num_cities == 0:
+        # No city to start from
+        return [], math.inf
+    distances = _get_distance_matrix(graph)
+    indices = np.arange(num_cities)
+    mask_full = (1 << num_cities) - 1
+
+    # Shortest distance from city i, through all cities not in mask, back to
+    # the starting city. Only masks including the starting city are filled.
+    distances_remaining = np.full((mask_full + 1, num_cities), np.inf)
+    cities_next = np.zeros((mask_full + 1, num_cities), dtype=np.intp)
+    distances_remaining[mask_full] = distances[:, 0]
+    for mask in range(mask_full - 2, 0, -2):
+        is_visited = (mask >> indices) & 1 == 1
+        # Distance remaining after moving to each unvisited city
+        distances_after_move = distances_remaining[mask | (1 << indices), indices]
+        distances_after_move[is_visited] = np.inf
+        # Pick best next city, for all current cities at once
+        distances_through = distances + distances_after_move
+        cities_next[mask] = np.argmin(distances_through, axis=1)
+        distances_remaining[mask] = distances_through[indices, cities_next[mask]]
+
+    path = [0]
+    mask = 1
+    while mask != mask_full:
+        path.append(int(cities_next[mask, path[-1]]))
+        mask |= 1 << path[-1]
+    # We need to return to starting city
+    path.append(0)
+    return [cities_all[index] for index in path], float(distances_remaining[1, 0])
+
+
+def _get_distance_matrix(graph: graphs.Graph) -> np.ndarray:
+    """Collect the weights of all connections into a NxN matrix, with zeros on the diagonal."""
+    cities_all = graph.values
+    distances = np.zeros((len(cities_all), len(cities_all)))
+    for index_1, city_1 in enumerate(cities_all):
+        for index_2, city_2 in enumerate(cities_all):
+            if index_1 != index_2:
+                distances[index_1, index_2] = graph.get_connection_weight(city_1, city_2)
+    return distances
@@ -0,0 +1,113 @@
+"""Probing kernels for open addressing hash tables, compiled to native code with Numba.
+
+Keys are stored in a contiguous int64 array, next to an array with the state of
+each bucket, so that a whole probe sequence runs as a single native loop,
+instead of a Python call and a tuple unpacking per probed bucket.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from dsa._jit import njit
+
+# States of a bucket. Deleted buckets are skipped by lookups, since the key they
+# held may have pushed other keys further down the probe sequence, but they can
+# be reused by insertions.
+EMPTY = 0
+OCCUPIED = 1
+DELETED = 2
+
+
+@njit("UniTuple(int64, 2)(int64[::1], uint8[::1], int64, int64, int64, boolean)", cache=True)
+def probe_compiled(
+    keys: np.ndarray, states: np.ndarray, key: int, index_hashed: int, step: int, is_quadratic: bool
+) -> tuple[int, int]:
+    """Probe buckets for key, starting at index_hashed.
+
+    The n-th probed bucket is `index_hashed + n * step` for linear probing and
+    double hashing, and `index_hashed + n * (n + 1) / 2` for quadratic probing,
+    wrapped around with a bitmask (the number of buckets is a power of two).
+
+    Returns the index of the bucket holding key, and the index of the first
+    bucket where key can be inserted, or -1 for either if there is none.
+    """
+    mask = len(keys) - 1
+    index_free = -1
+    for num_attempt in range(len(keys)):
+        offset = (num_attempt * (num_attempt + 1)) >> 1 if is_quadratic else num_attempt * step
+        index = (index_hashed + offset) & mask
+        state = states[index]
+        if state == EMPTY:
+            # Key would have been inserted here, so it cannot be further down
+            return -1, index if index_free < 0 else index_free
+        if state == OCCUPIED:
+            if keys[index] == key:
+                return index, index_free
+        elif index_free < 0:
+            index_free = index
+    return -1, index_free
+
+
+@njit("UniTuple(int64, 2)(int64[::1], uint8[::1], int64[::1], int64, int64)", cache=True)
+def probe_robin_hood_compiled(
+    keys: np.ndarray, states: np.ndarray, distances: np.ndarray, key: int, index_hashed: int
+) -> tuple[int, int]:
+    """Probe buckets for key linearly, starting at index_hashed, Robin Hood style.
+
+    Keys further from the bucket they are hashed to are never behind keys that
+    are closer, so the search stops as soon as it meets a key closer to its own
+    bucket than key would be, instead of going on until an empty bucket.
+
+    Returns the index of the bucket holding key, and the index of the bucket
+    where key would be inserted, or -1 for either if there is none.
+    """
+    mask = len(keys) - 1
+    for distance in range(len(keys)):
+        index = (index_hashed + distance) & mask
+        if states[index] == EMPTY or distances[index] < distance:
+            return -1, index
+        if keys[index] == key:
+            return index, -1
+    return -1, -1
+
+
+@njit("int64(int64[::1], uint8[::1], int64[::1], int64, int64, int64)", cache=True)
+def insert_robin_hood_compiled(
+    keys: np.ndarray, states: np.ndarray, distances: np.ndarray, key: int, distance: int, index: int
+) -> int:
+    """Insert key at index, moving the keys after it one bucket further.
+
+    There must be at least one empty bucket. Returns the index of the bucket
+    where the moved keys end.
+    """
+    mask = len(keys) - 1
+    while states[index] == OCCUPIED:
+        keys[index], key = key, keys[index]
+        distances[index], distance = distance, distances[index] + 1
+        index = (index + 1) & mask
+    keys[index] = key
+    distances[index] = distance
+    states[index] = OCCUPIED
+    return index
+
+
+@njit("int64(int64[::1], uint8[::1], int64[::1], int64)", cache=True)
+def delete_robin_hood_compiled(keys: np.ndarray, states: np.ndarray, distances: np.ndarray, index: int) -> int:
+    """Delete key at index, moving the keys after it one bucket back.
+
+    Keys are moved until one is met in the bucket it is hashed to, so that no
+    deleted bucket has to be left behind. Returns the index of the bucket that
+    is emptied.
+    """
+    mask = len(keys) - 1
+    for _ in range(len(keys) - 1):
+        index_next = (index + 1) & mask
+        if states[index_next] != OCCUPIED or distances[index_next] == 0:
+            break
+        keys[index] = keys[index_next]
+        distances[index] = distances[index_next] - 1
+        index = index_next
+    states[index] = EMPTY
+    distances[index] = 0
+    return index
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
 import abc
-import collections
 import math
-from typing import Iterator, Literal, NamedTuple, Self, TypeAlias, TypeVar
+from typing import Iterable, Iterator, Literal, NamedTuple, Self, TypeAlias, TypeVar
 
-RepresentationType: TypeAlias = Literal["adjacency_list", "adjacency_matrix", "pointers_and_objects"]
+import numpy as np
+
+RepresentationType: TypeAlias = Literal[
+    "adjacency_list", "compressed_sparse_row", "adjacency_matrix", "pointers_and_objects"
+]
 
 ValueType = TypeVar("ValueType")
 WeightType: TypeAlias = float
@@ -18,6 +21,8 @@ class Graph:
         self._representation = self._get_representation(representation)
         self._directed = directed
         self._values: list[ValueType] = []
+        # Position of each value in self._values, for lookups in O(1)
+        self._index_by_value: dict[ValueType, int] = {}
 
     @property
     def values(self) -> list[ValueType]:
@@ -40,17 +45,44 @@ class Graph:
         Space: O(V)
         """
         index = self._get_index(value)
-        has_been_traversed = len(self) * [False]
+        if isinstance(self._representation, _AdjacencyMatrix):
+            yield from self._traverse_BFS_adjacency_matrix(index)
+            return
+
+        # One byte per node, instead of a pointer to a boolean object
+        has_been_traversed = bytearray(len(self))
+        has_been_traversed[index] = 1
+
+        # Bound methods are looked up once, instead of once per node
+        iterate_neighbors = self._representation.iterate_neighbors
+        values = self._values
+
+        # Level by level, with the nodes of the next level collected in a
+        # separate list while the current one is traversed. This yields the
+        # same order as a first in, first out queue.
+        indices_level = [index]
+        while indices_level:
+            indices_level_next = []
+            append = indices_level_next.append
+            for index in indices_level:
+                yield values[index]
+                for index_neighbor, _ in iterate_neighbors(index):
+                    if not has_been_traversed[index_neighbor]:
+                        has_been_traversed[index_neighbor] = 1
+                        append(index_neighbor)
+            indices_level = indices_level_next
+
+    def _traverse_BFS_adjacency_matrix(self, index: int) -> Iterator[ValueType]:
+        # Each level is found with a few array operations on the rows of the
+        # current level, instead of a Python loop per node and neighbor
+        has_been_traversed = np.zeros(len(self), dtype=bool)
         has_been_traversed[index] = True
-
-        queue = collections.deque([index])
-        while queue:
-            index = queue.pop()
-            yield self._values[index]
-            for index_neighbor, _ in self._representation.iterate_neighbors(index):
-                if not has_been_traversed[index_neighbor]:
-                    has_been_traversed[index_neighbor] = True
-                    queue.insert(0, index_neighbor)
+        indices_level = np.array([index])
+        while len(indices_level):
+            for index in indices_level.tolist():
+                yield self._values[index]
+            indices_level = self._representation.get_next_level(indices_level, has_been_traversed)
+            has_been_traversed[indices_level] = True
 
     def traverse_DFS(self, value: ValueType) -> Iterator[ValueType]:
         """Depth-First Search graph traversal.
@@ -63,20 +95,34 @@ class Graph:
         Complexity
         ----------
         Time: O(V + E)
-        Space: O(V + E)
+        Space: O(V)
         """
-        has_been_traversed = len(self) * [False]
+        # One byte per node, instead of a pointer to a boolean object
+        has_been_traversed = bytearray(len(self))
 
-        def traverse(index: int) -> Iterator[int]:
-            if has_been_traversed[index]:
-                return
-            yield index
-            has_been_traversed[index] = True
-            for index_neighbor, _ in self._representation.iterate_neighbors(index):
-                yield from traverse(index_neighbor)
-
-        for index in traverse(self._get_index(value)):
-            yield self._values[index]
+        index = self._get_index(value)
+        has_been_traversed[index] = 1
+        yield self._values[index]
+
+        # Bound methods are looked up once, instead of once per node
+        iterate_neighbors = self._representation.iterate_neighbors
+        values = self._values
+
+        # Last in, first out. Each node on the path from the start keeps its
+        # iterator over neighbors, so that going back to it resumes where it
+        # left off, instead of going through its neighbors again.
+        stack = [iter(iterate_neighbors(index))]
+        append, pop = stack.append, stack.pop
+        while stack:
+            for index_neighbor, _ in stack[-1]:
+                if not has_been_traversed[index_neighbor]:
+                    has_been_traversed[index_neighbor] = 1
+                    yield values[index_neighbor]
+                    append(iter(iterate_neighbors(index_neighbor)))
+                    break
+            else:
+                # All neighbors have been traversed
+                pop()
 
     def iterate_neighbors(self, value: ValueType) -> Iterator[tuple[ValueType, WeightType]]:
         """Iterate through adjacent nodes and correpsonding edge weights.
@@ -92,11 +138,12 @@ class Graph:
 
     def has_value(self, value: ValueType) -> bool:
         """Check if value exists in graph or not."""
-        return value in self._values
+        return value in self._index_by_value
 
     def add_value(self, value: ValueType) -> None:
         """Add value to graph."""
         assert not self.has_value(value)
+        self._index_by_value[value] = len(self._values)
         self._values.append(value)
         self._representation.add_node()
 
@@ -104,6 +151,10 @@ class Graph:
         """Delete value from graph."""
         index = self._get_index(value)
         del self._values[index]
+        # Values after the deleted one move one position down
+        del self._index_by_value[value]
+        for index_shifted in range(index, len(self._values)):
+            self._index_by_value[self._values[index_shifted]] = index_shifted
         self._representation.delete_node(index)
 
     def has_connection(self, value_1: ValueType, value_2: ValueType) -> bool:
@@ -114,39 +165,43 @@ class Graph:
 
     def get_connection_weight(self, value_1: ValueType, value_2: ValueType) -> WeightType:
         """Get weight of connection between values."""
-        assert self.has_connection(value_1, value_2)
         index_1 = self._get_index(value_1)
         index_2 = self._get_index(value_2)
+        assert self._representation.has_edge(index_1, index_2)
         return self._representation.get_edge(index_1, index_2)
 
     def add_connection(self, value_1: ValueType, value_2: ValueType, *, weight: WeightType = 1.0) -> None:
         """Add direct connection between values."""
         assert weight > 0.0
-        assert not self.has_connection(value_1, value_2)
         index_1 = self._get_index(value_1)
         index_2 = self._get_index(value_2)
+        assert not self._representation.has_edge(index_1, index_2)
         self._representation.add_edge(index_1, index_2, weight=weight)
         if not self._directed:
             self._representation.add_edge(index_2, index_1, weight=weight)
 
     def delete_connection(self, value_1: ValueType, value_2: ValueType) -> None:
         """Delete direct connection between values."""
-        assert self.has_connection(value_1, value_2)
         index_1 = self._get_index(value_1)
         index_2 = self._get_index(value_2)
+        assert self._representation.has_edge(index_1, index_2)
         self._representation.delete_edge(index_1, index_2)
         if not self._directed:
             self._representation.delete_edge(index_2, index_1)
 
     def _get_index(self, value: ValueType) -> int:
-        assert self.has_value(value)
-        return self._values.index(value)
+        # A single dict lookup, for both the check and the index
+        index = self._index_by_value.get(value)
+        assert index is not None
+        return index
 
     @staticmethod
     def _get_representation(representation: RepresentationType) -> _GraphRepresentation:
         match representation:
             case "adjacency_list":
                 return _AdjacencyList()
+            case "compressed_sparse_row":
+                return _CompressedSparseRow()
             case "adjacency_matrix":
                 return _AdjacencyMatrix()
             case "pointers_and_objects":
@@ -169,7 +224,7 @@ class _GraphRepresentation(abc.ABC):
     def num_nodes(self) -> int: ...
 
     @abc.abstractmethod
-    def iterate_neighbors(self, index: int) -> Iterator[_NodeAndWeight]: ...
+    def iterate_neighbors(self, index: int) -> Iterable[tuple[int, WeightType]]: ...
 
     @abc.abstractmethod
     def add_node(self) -> None: ...
@@ -193,8 +248,10 @@ class _GraphRepresentation(abc.ABC):
 class _AdjacencyList(_GraphRepresentation):
     """Adjacency List graph representation.
 
-    Uses a list of lists to keep track of edges. Each row contains the neighbors
-    indices for that node.
+    Uses a list of dicts to keep track of edges. Each dict maps the neighbors
+    indices for that node to the corresponding edge weights, so that an edge
+    is found by hashing, instead of scanning the neighbors. Neighbors are kept
+    in ascending order of index, for iteration.
 
     Ideal for sparse graphs.
 
@@ -204,55 +261,158 @@ class _AdjacencyList(_GraphRepresentation):
     """
 
     def __init__(self) -> None:
-        self._adjacency_list: list[list[_NodeAndWeight]] = []
+        self._adjacency_list: list[dict[int, WeightType]] = []
 
     @property
     def num_nodes(self) -> int:
         return len(self._adjacency_list)
 
-    def iterate_neighbors(self, index: int) -> Iterator[_NodeAndWeight]:
-        # O(E)
-        yield from self._adjacency_list[index]
+    def iterate_neighbors(self, index: int) -> Iterable[tuple[int, WeightType]]:
+        # O(1), the dict view is iterated directly, without a generator
+        return self._adjacency_list[index].items()
 
     def add_node(self) -> None:
         # O(1)
-        self._adjacency_list.append([])
+        self._adjacency_list.append({})
 
     def delete_node(self, index: int) -> None:
-        # O(N + E)
-        for index_neighbor in range(len(self._adjacency_list)):
-            if index_neighbor != index:
-                self.delete_edge(index_neighbor, index)
+        # O(V + E)
         del self._adjacency_list[index]
+        # Nodes after the deleted one move one position down, which keeps them in order
+        self._adjacency_list = [
+            {
+                index_neighbor - (index_neighbor > index): weight
+                for index_neighbor, weight in neighbors.items()
+                if index_neighbor != index
+            }
+            for neighbors in self._adjacency_list
+        ]
 
     def has_edge(self, index_1: int, index_2: int) -> bool:
-        # O(E)
-        return any(index_and_weight.index == index_2 for index_and_weight in self._adjacency_list[index_1])
+        # O(1)
+        return index_2 in self._adjacency_list[index_1]
 
     def get_edge(self, index_1: int, index_2: int) -> WeightType:
-        # O(E)
-        for index_and_weight in self._adjacency_list[index_1]:
-            if index_and_weight.index == index_2:
-                return index_and_weight.weight
-        return math.inf
+        # O(1)
+        return self._adjacency_list[index_1].get(index_2, math.inf)
 
     def add_edge(self, index_1: int, index_2: int, *, weight: WeightType) -> None:
-        # O(E)
-        self._adjacency_list[index_1].append(_NodeAndWeight(index_2, weight))
-        self._adjacency_list[index_1].sort(key=lambda t: t.index)
+        # O(1) when adding neighbors in order, O(E log E) otherwise
+        neighbors = self._adjacency_list[index_1]
+        is_in_order = not neighbors or index_2 > next(reversed(neighbors))
+        neighbors[index_2] = weight
+        if not is_in_order:
+            self._adjacency_list[index_1] = dict(sorted(neighbors.items()))
 
     def delete_edge(self, index_1: int, index_2: int) -> None:
+        # O(1)
+        self._adjacency_list[index_1].pop(index_2, None)
+
+
+class _CompressedSparseRow(_GraphRepresentation):
+    """Compressed Sparse Row graph representation.
+
+    Uses three arrays to keep track of edges. The neighbors indices of all
+    nodes are stored one after the other in a single array, and the edge
+    weights in another one of the same length. The neighbors of node i are
+    found between positions indptr[i] and indptr[i + 1] of these arrays, in
+    ascending order of index.
+
+    Neighbors of a node are in consecutive memory, instead of scattered in
+    per-node containers, so iterating over them is cache friendly. On the
+    other hand, adding and deleting edges moves the edges that come after.
+
+    Ideal for sparse graphs that are mostly read.
+
+    Complexity
+    ----------
+    Space: O(V + E)
+    """
+
+    def __init__(self) -> None:
+        self._indptr = np.zeros(1, dtype=np.intp)
+        self._indices = np.zeros(0, dtype=np.intp)
+        self._weights = np.zeros(0, dtype=np.float64)
+
+    @property
+    def num_nodes(self) -> int:
+        return len(self._indptr) - 1
+
+    def iterate_neighbors(self, index: int) -> Iterable[tuple[int, WeightType]]:
         # O(E)
-        for index_and_weight in self._adjacency_list[index_1]:
-            if index_and_weight.index == index_2:
-                self._adjacency_list[index_1].remove(index_and_weight)
+        index_start, index_end = self._indptr[index], self._indptr[index + 1]
+        return zip(self._indices[index_start:index_end].tolist(), self._weights[index_start:index_end].tolist())
+
+    def add_node(self) -> None:
+        # O(V)
+        self._indptr = np.append(self._indptr, self._indptr[-1])
+
+    def delete_node(self, index: int) -> None:
+        # O(V + E)
+        index_start, index_end = self._indptr[index], self._indptr[index + 1]
+        self._indices = np.delete(self._indices, np.s_[index_start:index_end])
+        self._weights = np.delete(self._weights, np.s_[index_start:index_end])
+        self._indptr = np.delete(self._indptr, index + 1)
+        self._indptr[index + 1 :] -= index_end - index_start
+
+        # Edges to the deleted node, and the number of them before each position
+        is_deleted = self._indices == index
+        num_deleted_before = np.concatenate(([0], np.cumsum(is_deleted)))
+        self._indptr -= num_deleted_before[self._indptr]
+        self._indices = self._indices[~is_deleted]
+        self._weights = self._weights[~is_deleted]
+        self._indices[self._indices > index] -= 1
+
+    def has_edge(self, index_1: int, index_2: int) -> bool:
+        # O(log E)
+        return self._find_edge(index_1, index_2) is not None
+
+    def get_edge(self, index_1: int, index_2: int) -> WeightType:
+        # O(log E)
+        position = self._find_edge(index_1, index_2)
+        return math.inf if position is None else float(self._weights[position])
+
+    def add_edge(self, index_1: int, index_2: int, *, weight: WeightType) -> None:
+        # O(V + E)
+        position = self._find_edge(index_1, index_2)
+        if position is not None:
+            self._weights[position] = weight
+            return
+        index_start, index_end = self._indptr[index_1], self._indptr[index_1 + 1]
+        position = index_start + np.searchsorted(self._indices[index_start:index_end], index_2)
+        self._indices = np.insert(self._indices, position, index_2)
+        self._weights = np.insert(self._weights, position, weight)
+        self._indptr[index_1 + 1 :] += 1
+
+    def delete_edge(self, index_1: int, index_2: int) -> None:
+        # O(V + E)
+        position = self._find_edge(index_1, index_2)
+        if position is None:
+            return
+        self._indices = np.delete(self._indices, position)
+        self._weights = np.delete(self._weights, position)
+        self._indptr[index_1 + 1 :] -= 1
+
+    def _find_edge(self, index_1: int, index_2: int) -> int | None:
+        # O(log E), with a binary search in the sorted neighbors
+        index_start, index_end = self._indptr[index_1], self._indptr[index_1 + 1]
+        position = index_start + int(np.searchsorted(self._indices[index_start:index_end], index_2))
+        if position < index_end and self._indices[position] == index_2:
+            return position
+        return None
 
 
 class _AdjacencyMatrix(_GraphRepresentation):
     """Adjacency Matrix graph representation.
 
-    Uses a VxV matrix to keep track of edges. The ij-th element is `True` if
-    node i is connected to node j, and `False` otherwise.
+    Uses a VxV matrix to keep track of edges. The ij-th element is the weight
+    of the edge from node i to node j, and zero if there is no such edge.
+
+    The matrix is a single contiguous NumPy array, instead of a list of rows,
+    so that scanning a row reads consecutive memory, without a pointer
+    dereference per cell. Like a Python list, the array has spare capacity,
+    which doubles whenever it runs out, so that adding nodes one by one does
+    not copy the whole matrix every time.
 
     Ideal for dense graphs.
 
@@ -262,7 +422,10 @@ class _AdjacencyMatrix(_GraphRepresentation):
     """
 
     def __init__(self) -> int:
-        self._adjacency_matrix: list[list[WeightType]] = []
+        # Cells outside of the first V rows and columns are always zero
+        self._adjacency_matrix_buffer = np.zeros((0, 0), dtype=np.float64)
+        # View of the first V rows and columns of the buffer
+        self._adjacency_matrix = self._adjacency_matrix_buffer[:0, :0]
 
     @property
     def num_nodes(self) -> int:
@@ -270,44 +433,63 @@ class _AdjacencyMatrix(_GraphRepresentation):
 
     def iterate_neighbors(self, index: int) -> Iterator[_NodeAndWeight]:
         # O(V)
-        for index_neighbor, weight in enumerate(self._adjacency_matrix[index]):
-            if weight > 0.0:
-                yield _NodeAndWeight(index_neighbor, weight)
+        row = self._adjacency_matrix[index]
+        for index_neighbor in np.flatnonzero(row).tolist():
+            yield _NodeAndWeight(index_neighbor, float(row[index_neighbor]))
 
-    def add_node(self) -> None:
+    def get_next_level(self, indices_level: np.ndarray, has_been_traversed: np.ndarray) -> np.ndarray:
         # O(V**2)
-        self._adjacency_matrix.append(self.num_nodes * [0.0])
-        for row in self._adjacency_matrix:
-            row.append(0.0)
+        is_connected = self._adjacency_matrix[indices_level] != 0
+        indices_level_next = np.flatnonzero(is_connected.any(axis=0) & ~has_been_traversed)
+        # Order by the first node of the current level connected to each node,
+        # which is the order a first in, first out queue would find them in
+        indices_first_connected = is_connected[:, indices_level_next].argmax(axis=0)
+        return indices_level_next[np.argsort(indices_first_connected, kind="stable")]
+
+    def add_node(self) -> None:
+        # O(1) amortized, O(V**2) when the capacity runs out
+        num_nodes = self.num_nodes
+        if num_nodes == len(self._adjacency_matrix_buffer):
+            capacity = max(1, 2 * num_nodes)
+            buffer = np.zeros((capacity, capacity), dtype=np.float64)
+            buffer[:num_nodes, :num_nodes] = self._adjacency_matrix
+            self._adjacency_matrix_buffer = buffer
+        self._adjacency_matrix = self._adjacency_matrix_buffer[: num_nodes + 1, : num_nodes + 1]
 
     def delete_node(self, index: int) -> None:
         # O(V**2)
-        del self._adjacency_matrix[index]
-        for row in self._adjacency_matrix:
-            del row[index]
+        num_nodes = self.num_nodes
+        buffer = self._adjacency_matrix_buffer
+        # Shift the rows and columns after the deleted one, in place
+        buffer[index : num_nodes - 1, :num_nodes] = buffer[index + 1 : num_nodes, :num_nodes]
+        buffer[:num_nodes, index : num_nodes - 1] = buffer[:num_nodes, index + 1 : num_nodes]
+        buffer[num_nodes - 1, :num_nodes] = 0.0
+        buffer[:num_nodes, num_nodes - 1] = 0.0
+        self._adjacency_matrix = buffer[: num_nodes - 1, : num_nodes - 1]
 
     def has_edge(self, index_1: int, index_2: int) -> bool:
         # O(1)
-        return self._adjacency_matrix[index_1][index_2] > 0.0
+        return bool(self._adjacency_matrix[index_1, index_2] > 0.0)
 
     def get_edge(self, index_1: int, index_2: int) -> WeightType:
-        return self._adjacency_matrix[index_1][index_2]
+        # O(1)
+        return float(self._adjacency_matrix[index_1, index_2])
 
     def add_edge(self, index_1: int, index_2: int, *, weight: WeightType) -> None:
         # O(1)
         assert weight > 0.0
-        self._adjacency_matrix[index_1][index_2] = weight
+        self._adjacency_matrix[index_1, index_2] = weight
 
     def delete_edge(self, index_1: int, index_2: int) -> None:
         # O(1)
-        self._adjacency_matrix[index_1][index_2] = 0.0
+        self._adjacency_matrix[index_1, index_2] = 0.0
 
 
 class _PointersAndObjects(_GraphRepresentation):
     """Pointers and Objects graph representation.
 
     Uses a pointer list of length V to keep track of nodes. Each `Node`
-    is an object that holds a list of its neighbors.
+    is an object that holds a dict of its neighbors.
 
     Complexity
     ----------
@@ -332,59 +514,62 @@ class _PointersAndObjects(_GraphRepresentation):
 
     def delete_node(self, index: int) -> None:
         # O(V)
-        del self._nodes[index]
-        for index, node in enumerate(self._nodes):
-            node.index = index
+        node_deleted = self._nodes.pop(index)
+        # Only nodes after the deleted one change position
+        for index_shifted in range(index, len(self._nodes)):
+            self._nodes[index_shifted].index = index_shifted
+        for node in self._nodes:
+            if node.has_neighbor(node_deleted):
+                node.delete_neighbor(node_deleted)
 
     def has_edge(self, index_1: int, index_2: int) -> bool:
-        # O(E)
+        # O(1)
         return self._nodes[index_1].has_neighbor(self._nodes[index_2])
 
     def get_edge(self, index_1: int, index_2: int) -> WeightType:
-        # O(E)
-        return self._nodes[index_1].get_neighbor_weight(index_2)
+        # O(1)
+        return self._nodes[index_1].get_neighbor_weight(self._nodes[index_2])
 
     def add_edge(self, index_1: int, index_2: int, *, weight: WeightType) -> None:
-        # O(E)
+        # O(1) when adding neighbors in order, O(E log E) otherwise
         self._nodes[index_1].add_neighbor(self._nodes[index_2], weight=weight)
 
     def delete_edge(self, index_1: int, index_2: int) -> None:
-        # O(E)
+        # O(1)
         self._nodes[index_1].delete_neighbor(self._nodes[index_2])
 
 
 class _Node:
     def __init__(self, index: int) -> None:
         self.index = index
-        self._neighbors: list[tuple[Self, WeightType]] = []
+        # Neighbors and edge weights, keyed by the identity of the neighbors,
+        # in ascending order of index
+        self._neighbors: dict[int, tuple[Self, WeightType]] = {}
 
     def __iter__(self) -> Iterator[tuple[Self, WeightType]]:
         # O(E)
-        yield from self._neighbors
+        yield from self._neighbors.values()
 
     def has_neighbor(self, node: _Node) -> bool:
-        # O(E)
+        # O(1)
         assert node is not self
-        return any(node is neighbor for neighbor, _ in self._neighbors)
+        return id(node) in self._neighbors
 
     def get_neighbor_weight(self, node: _Node) -> WeightType:
-        # O(E)
+        # O(1)
         assert self.has_neighbor(node)
-        for neighbor, weight in self:
-            if neighbor is node:
-                return weight
-        raise AssertionError
+        _, weight = self._neighbors[id(node)]
+        return weight
 
     def add_neighbor(self, node: _Node, *, weight: WeightType) -> None:
-        # O(E)
+        # O(1) when adding neighbors in order, O(E log E) otherwise
         assert not self.has_neighbor(node)
-        self._neighbors.append((node, weight))
-        self._neighbors.sort(key=lambda t: t[0].index)
+        is_in_order = not self._neighbors or node.index > next(reversed(self._neighbors.values()))[0].index
+        self._neighbors[id(node)] = (node, weight)
+        if not is_in_order:
+            self._neighbors = dict(sorted(self._neighbors.items(), key=lambda t: t[1][0].index))
 
     def delete_neighbor(self, node: _Node) -> None:
-        # O(E)
-        for neighbor, weight in self:
-            if neighbor is node:
-                self._neighbors.remove((neighbor, weight))
-                return
-        raise AssertionError
+        # O(1)
+        assert self.has_neighbor(node)
+        del self._neighbors[id(node)]
@@ -1,14 +1,26 @@
 from __future__ import annotations
 
 import abc
-import math
-from typing import Iterator, Protocol, TypeAlias, TypeVar
+from typing import Callable, Iterator, Protocol, TypeAlias, TypeVar
+
+import numpy as np
+
+from dsa.data_structures import _hash_tables_numba
 
 # Integer universe assumption (TODO: String support)
 KeyType: TypeAlias = int
 ValueType = TypeVar("ValueType")
 KeyValuePairType: TypeAlias = tuple[KeyType, ValueType]
 
+# Machine word size, in bits, for multiplicative hashing
+_WORD_SIZE = 64
+# floor(2**64 * (sqrt(5) - 1) / 2), as suggested by Knuth for multiplicative
+# (a.k.a. Fibonacci) hashing
+_FIBONACCI_MULTIPLIER = 0x9E3779B97F4A7C15
+# Range of keys that the compiled probing kernels accept
+_INT64_MIN = -(2**63)
+_INT64_MAX = 2**63 - 1
+
 
 class HashTable(abc.ABC):
     """Associative array of key-value pairs, mapping keys to values.
@@ -34,15 +46,14 @@ class HashTable(abc.ABC):
 
     def __init__(self, *, hash_function: HashFunction, num_buckets: int = 32) -> None:
         assert num_buckets > 0
-        self._array: list[KeyValuePairType | None] = num_buckets * [None]
         self._hash_function = hash_function
+        self._allocate_buckets(num_buckets)
 
     @property
     def num_buckets(self) -> int:
         return len(self._array)
 
     @property
-    @abc.abstractmethod
     def load_factor(self) -> float:
         """Critical statistic of hash table.
 
@@ -50,6 +61,7 @@ class HashTable(abc.ABC):
         Large load factors increase the chance of hash collision, so they should
         be avoided by occasionally rehashing the table.
         """
+        return self._num_entries / self.num_buckets
 
     @abc.abstractmethod
     def __getitem__(self, key: KeyType) -> ValueType | None: ...
@@ -72,18 +84,41 @@ class HashTable(abc.ABC):
         return self._hash_function(key, self.num_buckets)
 
     def _rehash(self) -> None:
-        """Double the total number of buckets."""
+        """Double the total number of buckets.
+
+        Entries are inserted directly into the new array, without checking the
+        load factor after each one. If an entry cannot be placed, the number of
+        buckets is doubled again, and all entries are inserted from scratch.
+        """
         keys_and_values = list(self.items())
-        self.__init__(hash_function=self._hash_function, num_buckets=2 * self.num_buckets)
-        for key, value in keys_and_values:
-            self[key] = value
+        num_buckets = 2 * self.num_buckets
+        while True:
+            self._allocate_buckets(num_buckets)
+            try:
+                for key, value in keys_and_values:
+                    self._insert_value(key, value)
+            except AssertionError:
+                num_buckets *= 2
+            else:
+                return
+
+    def _allocate_buckets(self, num_buckets: int) -> None:
+        """Replace the underlying array with num_buckets empty buckets."""
+        self._array: list[KeyValuePairType | None] = num_buckets * [None]
+        # Kept up to date on insertion and deletion, instead of counted on demand
+        self._num_entries = 0
+
+    @abc.abstractmethod
+    def _insert_value(self, key: KeyType, value: ValueType | None) -> None:
+        """Insert, update or delete (if value is None) an entry, as is."""
 
 
 class SeparateChainingHashTable(HashTable):
     """Separate chain collision resolution technique.
 
-    Stores a linked-list of key-value pairs for each bucket in the array, used
-    to chain together pairs which are mapped to the same index.
+    Stores a chain of key-value pairs for each bucket in the array, used to
+    chain together pairs which are mapped to the same index. Each chain is a
+    dict, so that a key is found in it by hashing, instead of scanning it.
 
     Pros
     ----
@@ -101,19 +136,9 @@ class SeparateChainingHashTable(HashTable):
 
     def __init__(self, *, hash_function: HashFunction, num_buckets: int = 16) -> None:
         super().__init__(hash_function=hash_function, num_buckets=num_buckets)
-        self._array: list[list[KeyValuePairType]] = [[] for _ in range(self.num_buckets)]
-
-    @property
-    def load_factor(self) -> float:
-        num_entries = sum(len(entries) for entries in self._array)
-        return num_entries / self.num_buckets
 
     def __getitem__(self, key: KeyType) -> ValueType | None:
-        index = self._get_index(key)
-        for key_stored, value_stored in self._array[index]:
-            if key_stored == key:
-                return value_stored
-        return None
+        return self._array[self._get_index(key)].get(key)
 
     def __setitem__(self, key: KeyType, value: ValueType | None) -> None:
         self._insert_value(key, value)
@@ -122,19 +147,20 @@ class SeparateChainingHashTable(HashTable):
 
     def items(self) -> Iterator[KeyValuePairType]:
         for bucket in self._array:
-            yield from bucket
+            yield from bucket.items()
 
     def _insert_value(self, key: KeyType, value: ValueType | None) -> None:
-        index = self._get_index(key)
-        for subindex, (key_stored, _) in enumerate(self._array[index]):
-            if key_stored != key:
-                continue
-            if value is None:
-                self._array[index].pop(subindex)
-            else:
-                self._array[index][subindex] = (key, value)
-            return
-        self._array[index].append((key, value))
+        bucket = self._array[self._get_index(key)]
+        num_entries_bucket = len(bucket)
+        if value is None:
+            bucket.pop(key, None)
+        else:
+            bucket[key] = value
+        self._num_entries += len(bucket) - num_entries_bucket
+
+    def _allocate_buckets(self, num_buckets: int) -> None:
+        self._array: list[dict[KeyType, ValueType]] = [{} for _ in range(num_buckets)]
+        self._num_entries = 0
 
 
 class _OpenAddressingHashTable(HashTable, abc.ABC):
@@ -159,21 +185,24 @@ class _OpenAddressingHashTable(HashTable, abc.ABC):
     - More computations
     - Table can overflow, and require rehashing
     - Extra care needed to avoid clustering
+
+    Keys are kept in an int64 array, and probed with compiled kernels. Once a
+    key that does not fit in 64 bits is inserted, the array switches to Python
+    objects, and the same kernels run as plain Python instead.
     """
 
-    @property
-    def load_factor(self) -> float:
-        num_entries = len(self._array) - self._array.count(None)
-        return num_entries / self.num_buckets
+    # Whether the n-th probe is at an offset of n * (n + 1) / 2, instead of n * step
+    _is_probe_quadratic = False
+
+    def __init__(self, *, hash_function: HashFunction, num_buckets: int = 32) -> None:
+        # A power of two, so that indices wrap around with a bitmask instead of
+        # a modulo
+        assert num_buckets > 0
+        super().__init__(hash_function=hash_function, num_buckets=1 << (num_buckets - 1).bit_length())
 
     def __getitem__(self, key: KeyType) -> ValueType | None:
-        index_hashed = self._get_index(key)
-        for num_attempt in range(self.num_buckets):
-            index = self._compute_index(key, index_hashed, num_attempt)
-            entry = self._array[index]
-            if entry is not None and entry[0] == key:
-                return entry[1]
-        return None
+        index, _ = self._probe(key)
+        return self._array[index] if index >= 0 else None
 
     def __setitem__(self, key: KeyType, value: ValueType | None) -> None:
         try:
@@ -185,23 +214,56 @@ class _OpenAddressingHashTable(HashTable, abc.ABC):
             self._rehash()
 
     def items(self) -> Iterator[KeyValuePairType]:
-        for entry in self._array:
-            if entry is not None:
-                yield entry
+        for index in np.flatnonzero(self._states == _hash_tables_numba.OCCUPIED).tolist():
+            yield int(self._keys[index]), self._array[index]
 
     def _insert_value(self, key: KeyType, value: ValueType | None) -> None:
-        index_start = self._get_index(key)
-        for num_attempt in range(self.num_buckets):
-            index = self._compute_index(key, index_start, num_attempt)
-            entry = self._array[index]
-            if entry is None or entry[0] == key:
-                self._array[index] = (key, value) if value is not None else None
-                return
-        raise AssertionError
-
-    @abc.abstractmethod
-    def _compute_index(self, key: KeyType, index_hashed: int, num_attempt: int) -> int:
-        """Find next candidate for search/insertion."""
+        index, index_free = self._probe(key)
+        if index >= 0:
+            if value is None:
+                self._states[index] = _hash_tables_numba.DELETED
+                self._num_entries -= 1
+            self._array[index] = value
+            return
+        if value is None:
+            return
+        # No bucket left to probe
+        assert index_free >= 0
+        self._fit_key(key)
+        self._keys[index_free] = key
+        self._states[index_free] = _hash_tables_numba.OCCUPIED
+        self._array[index_free] = value
+        self._num_entries += 1
+
+    def _allocate_buckets(self, num_buckets: int) -> None:
+        super()._allocate_buckets(num_buckets)
+        self._mask = num_buckets - 1
+        # Keys and bucket states are kept in contiguous arrays, so that probing
+        # runs as a compiled loop. Values, which can be any objects, are kept
+        # in self._array, at the same index as their keys.
+        self._keys = np.zeros(num_buckets, dtype=np.int64)
+        self._states = np.full(num_buckets, _hash_tables_numba.EMPTY, dtype=np.uint8)
+
+    def _probe(self, key: KeyType) -> tuple[int, int]:
+        """Find bucket holding key, and first bucket where key can be inserted."""
+        return self._get_kernel(_hash_tables_numba.probe_compiled, key)(
+            self._keys, self._states, key, self._get_index(key), self._get_probe_step(key), self._is_probe_quadratic
+        )
+
+    def _get_kernel(self, kernel: Callable, key: KeyType) -> Callable:
+        """Kernel itself if key and stored keys fit in 64 bits, its plain Python version otherwise."""
+        if self._keys.dtype == object or not _INT64_MIN <= key <= _INT64_MAX:
+            return getattr(kernel, "py_func", kernel)
+        return kernel
+
+    def _fit_key(self, key: KeyType) -> None:
+        """Switch stored keys to Python objects, if key does not fit in 64 bits."""
+        if self._keys.dtype != object and not _INT64_MIN <= key <= _INT64_MAX:
+            self._keys = self._keys.astype(object)
+
+    def _get_probe_step(self, key: KeyType) -> int:
+        """Distance between consecutive probes for key."""
+        return 1
 
 
 class LinearProbingHashTable(_OpenAddressingHashTable):
@@ -217,27 +279,77 @@ class LinearProbingHashTable(_OpenAddressingHashTable):
     Cons
     ----
     - Can lead to clustering at small values
+
+    Keys are inserted Robin Hood style: a key that is further from the bucket it
+    is hashed to takes the place of a key that is closer to its own, which moves
+    one bucket further. This evens out the number of probes across keys, and
+    lets unsuccessful searches stop early. Deleted keys are filled in by moving
+    the keys after them one bucket back, instead of leaving deleted buckets.
     """
 
-    def _compute_index(self, key: KeyType, index_hashed: int, num_attempt: int) -> int:
-        return (index_hashed + num_attempt) % self.num_buckets
+    def _allocate_buckets(self, num_buckets: int) -> None:
+        super()._allocate_buckets(num_buckets)
+        # Distance of each key from the bucket it is hashed to
+        self._distances = np.zeros(num_buckets, dtype=np.int64)
+
+    def _probe(self, key: KeyType) -> tuple[int, int]:
+        return self._get_kernel(_hash_tables_numba.probe_robin_hood_compiled, key)(
+            self._keys, self._states, self._distances, key, self._get_index(key)
+        )
+
+    def _insert_value(self, key: KeyType, value: ValueType | None) -> None:
+        index_hashed = self._get_index(key)
+        index, index_insert = self._probe(key)
+        if index >= 0:
+            if value is None:
+                index_emptied = self._get_kernel(_hash_tables_numba.delete_robin_hood_compiled, key)(
+                    self._keys, self._states, self._distances, index
+                )
+                # Values follow their keys one bucket back
+                while index != index_emptied:
+                    index_next = (index + 1) & self._mask
+                    self._array[index] = self._array[index_next]
+                    index = index_next
+                self._array[index_emptied] = None
+                self._num_entries -= 1
+            else:
+                self._array[index] = value
+            return
+        if value is None:
+            return
+        # No bucket left to probe
+        assert index_insert >= 0 and self._num_entries < self.num_buckets
+        self._fit_key(key)
+        index = self._get_kernel(_hash_tables_numba.insert_robin_hood_compiled, key)(
+            self._keys, self._states, self._distances, key, (index_insert - index_hashed) & self._mask, index_insert
+        )
+        # Values follow their keys one bucket further
+        while index != index_insert:
+            index_previous = (index - 1) & self._mask
+            self._array[index] = self._array[index_previous]
+            index = index_previous
+        self._array[index_insert] = value
+        self._num_entries += 1
 
 
 class QuadraticProbingHashTable(_OpenAddressingHashTable):
     """Quadratic probing open addressing collision resolution technique.
 
-    Look at the n**2-th bucket in sequence at the n-th iteration. This method
-    offers a good compromise between clustering prevention and cache performance.
+    Look at the (n * (n + 1) / 2)-th bucket in sequence at the n-th iteration.
+    This method offers a good compromise between clustering prevention and cache
+    performance. With a power of two number of buckets, these triangular numbers
+    go through all buckets, which is not the case for n**2.
     """
 
-    def _compute_index(self, key: KeyType, index_hashed: int, num_attempt: int) -> int:
-        return (index_hashed + num_attempt**2) % self.num_buckets
+    _is_probe_quadratic = True
 
 
 class DoubleHashingHashTable(_OpenAddressingHashTable):
     """Double hashing open addressing collision resolution technique.
 
     Use a second hash function to find next candidate for search or insertion.
+    The second hash function returns an odd step, which has no common factor with
+    the power of two number of buckets, so that all buckets are probed.
 
     Pros
     ----
@@ -248,12 +360,8 @@ class DoubleHashingHashTable(_OpenAddressingHashTable):
     - Poor cache performance
     """
 
-    def _compute_index(self, key: KeyType, index_hashed: int, num_attempt: int) -> int:
-        return (index_hashed + num_attempt * self._hash_function_2(key)) % self.num_buckets
-
-    def _hash_function_2(self, key: KeyType) -> int:
-        prime = 11
-        return prime - (key % prime)
+    def _get_probe_step(self, key: KeyType) -> int:
+        return ((key * _FIBONACCI_MULTIPLIER) | 1) & self._mask
 
 
 class HashFunction(Protocol):
@@ -276,6 +384,9 @@ def division_method(key: KeyType, num_buckets: int) -> int:
     within bounds. It has been found that the best results are obtained when a
     prime number close to `num_buckets` is used as the divisor.
 
+    When `num_buckets` is a power of two (as in open addressing tables), the
+    remainder is just the lowest bits of the key, taken with a bitmask.
+
     Pros
     ----
     - Simple
@@ -285,6 +396,9 @@ def division_method(key: KeyType, num_buckets: int) -> int:
     - Clustering
     - Sensitive to table size
     """
+    mask = num_buckets - 1
+    if num_buckets & mask == 0:
+        return key & mask
     return key % num_buckets
 
 
@@ -295,22 +409,27 @@ def multiplication_method(key: KeyType, num_buckets: int) -> int:
     it by the bucket size, and then floors it.
 
     The constant is typically chosen as `s / 2**w`, where `w` is the machine
-    word size, and `s` is a constant within `(0, 2**w)`.
+    word size, and `s` is a constant within `(0, 2**w)`. Here `w = 64` and
+    `s = floor(2**w * (sqrt(5) - 1) / 2)`, as suggested by Knuth (Fibonacci
+    hashing). The fractional part is then the lowest `w` bits of `key * s`, so
+    the whole computation is done with integers, without floating point
+    rounding. For a power of two number of buckets `2**k`, this amounts to the
+    top `k` of those bits.
 
     Pros
     ----
     - Simple
     - Insensitive to table size
     """
-    word_size = 64
-    fractional_part = (key * 1.0 / word_size**2) % 1
-    return math.floor(num_buckets * fractional_part)
+    fractional_part = (key * _FIBONACCI_MULTIPLIER) & ((1 << _WORD_SIZE) - 1)
+    return (num_buckets * fractional_part) >> _WORD_SIZE
 
 
 def midsquare_method(key: KeyType, num_buckets: int) -> int:
     """Mid-square hashing method.
 
-    Takes the middle digits of the squared input integer.
+    Takes the middle bits of the squared input integer, as many as needed to
+    index the buckets. The middle bits depend on all bits of the key.
 
     Pros
     ----
@@ -321,12 +440,8 @@ def midsquare_method(key: KeyType, num_buckets: int) -> int:
     - More complex
     - Poor performance in case of many trailing or leading zeros
     """
-    key_squared_str = str(key**2)
-    num_digits_bucket = len(str(num_buckets))
-    num_digits_key_squared = len(key_squared_str)
-    if num_digits_key_squared < num_digits_bucket:
-        pad_size = num_digits_bucket - num_digits_key_squared
-        key_squared_str = key_squared_str.zfill(pad_size)
-    index_middle = len(key_squared_str) // 2
-    middle_digits = int(key_squared_str[index_middle - num_buckets // 2 : index_middle + num_buckets // 2])
-    return middle_digits % num_buckets
+    key_squared = key * key
+    num_bits_index = max(1, (num_buckets - 1).bit_length())
+    # Drop the lowest bits, so that the middle ones end up at the bottom
+    shift = max(0, (key_squared.bit_length() - num_bits_index) // 2)
+    return (key_squared >> shift) % num_buckets
@@ -27,8 +27,8 @@ class LinkedList(abc.ABC):
     def __init__(self, values: Sequence[ValueType] | None = None) -> None: ...
 
     def __len__(self) -> int:
-        # O(N)
-        return sum(1 for _ in self)
+        # O(1), since the number of nodes is kept up to date on insertion and deletion
+        return self._size
 
     def __iter__(self) -> Iterator[ValueType]:
         # O(N)
@@ -52,11 +52,17 @@ class LinkedList(abc.ABC):
     @abc.abstractmethod
     def _iterate_nodes(self) -> Iterator[_Node]: ...
 
+    @abc.abstractmethod
+    def _get_first_node(self) -> _Node | None: ...
+
     def _get_node(self, index: int) -> _Node:
-        for index_current, node in enumerate(self._iterate_nodes()):
-            if index_current == index:
-                return node
-        raise IndexError
+        # O(N), following the pointers in a plain loop, instead of a generator
+        if not 0 <= index < len(self):
+            raise IndexError
+        node = self._get_first_node()
+        for _ in range(index):
+            node = node.head
+        return node
 
 
 class SinglyLinkedList(LinkedList):
@@ -65,6 +71,7 @@ class SinglyLinkedList(LinkedList):
     def __init__(self, values: Sequence[ValueType] | None = None) -> None:
         # O(N)
         self._head = self._create_nodes_and_return_head(values) if values else None
+        self._size = len(values) if values else 0
 
     def insert(self, index: int, value: ValueType) -> None:
         # O(N), since we are not given the previous node, but an index
@@ -78,6 +85,7 @@ class SinglyLinkedList(LinkedList):
             node_tail = self._get_node(index - 1)
             node_inserted.head = node_tail.head
             node_tail.head = node_inserted
+        self._size += 1
 
     def delete(self, index: int) -> None:
         # O(N), since we are not given the previous node, but an index
@@ -86,6 +94,7 @@ class SinglyLinkedList(LinkedList):
         else:
             node_tail = self._get_node(index - 1)
             node_tail.head = node_tail.head.head
+        self._size -= 1
 
     def _iterate_nodes(self) -> Iterator[_Node]:
         node = self._head
@@ -93,6 +102,9 @@ class SinglyLinkedList(LinkedList):
             yield node
             node = node.head
 
+    def _get_first_node(self) -> _Node | None:
+        return self._head
+
     @staticmethod
     def _create_nodes_and_return_head(values: Sequence[ValueType]) -> _Node:
         head = _Node(values[0])
@@ -109,6 +121,7 @@ class DoublyLinkedList(LinkedList):
     def __init__(self, values: Sequence[ValueType] | None = None) -> None:
         # O(N)
         self._head, self._tail = self._create_nodes_and_return_head_and_tail(values) if values else (None, None)
+        self._size = len(values) if values else 0
 
     def traverse_reverse(self) -> Iterator[ValueType]:
         node = self._tail
@@ -138,11 +151,12 @@ class DoublyLinkedList(LinkedList):
             self._tail = node_inserted
 
         else:
-            # Insert between index - 1 and index
+            # Insert between index - 1 and index, walking the list only once
             node_inserted.tail = self._get_node(index - 1)
-            node_inserted.head = self._get_node(index)
+            node_inserted.head = node_inserted.tail.head
             node_inserted.tail.head = node_inserted
             node_inserted.head.tail = node_inserted
+        self._size += 1
 
     def delete(self, index: int) -> None:
         # O(N), since we are not given a node, but an index
@@ -163,11 +177,12 @@ class DoublyLinkedList(LinkedList):
             self._tail.head = None
 
         else:
-            # Delete element in middle
+            # Delete element in middle, walking the list only once
             tail = self._get_node(index - 1)
-            head = self._get_node(index + 1)
+            head = tail.head.head
             tail.head = head
             head.tail = tail
+        self._size -= 1
 
     def _iterate_nodes(self) -> Iterator[_Node]:
         node = self._head
@@ -175,6 +190,18 @@ class DoublyLinkedList(LinkedList):
             yield node
             node = node.head
 
+    def _get_first_node(self) -> _Node | None:
+        return self._head
+
+    def _get_node(self, index: int) -> _Node:
+        # O(N), but starting from whichever end is closer to the node
+        if not len(self) // 2 <= index < len(self):
+            return super()._get_node(index)
+        node = self._tail
+        for _ in range(len(self) - 1 - index):
+            node = node.tail
+        return node
+
     @staticmethod
     def _create_nodes_and_return_head_and_tail(values: Sequence[ValueType]) -> tuple[_Node, _Node]:
         head = _Node(values[0])
@@ -193,6 +220,7 @@ class CircularSinglyLinkedList(LinkedList):
     def __init__(self, values: Sequence[ValueType] | None = None) -> None:
         # O(N)
         self._tail = self._create_nodes_and_return_tail(values) if values else None
+        self._size = len(values) if values else 0
 
     def insert(self, index: int, value: ValueType) -> None:
         # O(N), since we are not given a node, but an index
@@ -216,6 +244,7 @@ class CircularSinglyLinkedList(LinkedList):
             tail = self._get_node(index - 1)
             node_inserted.head = tail.head
             tail.head = node_inserted
+        self._size += 1
 
     def delete(self, index: int) -> None:
         # O(N), since we are not given a node, but an index
@@ -224,25 +253,27 @@ class CircularSinglyLinkedList(LinkedList):
         if node_previous.head is node_previous:
             self._tail = None
         else:
+            if node_previous.head is self._tail:
+                # Delete last element
+                self._tail = node_previous
             node_previous.head = node_previous.head.head
+        self._size -= 1
 
     def _iterate_nodes(self) -> Iterator[_Node]:
-        if self._tail is None:
-            return
-        head_node = self._tail.head
-        yield head_node
-        node = head_node.head
-        while node is not head_node:
-            yield node
+        # The size is known, so a counted loop stops the iteration, instead of
+        # checking whether the first node has been reached again
+        node = self._tail
+        for _ in range(len(self)):
             node = node.head
+            yield node
+
+    def _get_first_node(self) -> _Node | None:
+        return self._tail.head if self._tail is not None else None
 
     def _get_previous_node(self, index) -> _Node:
         if index == 0:
             return self._tail
-        try:
-            return self._get_node(index - 1)
-        except IndexError:
-            return None
+        return self._get_node(index - 1)
 
     @staticmethod
     def _create_nodes_and_return_tail(values: Sequence[ValueType]) -> _Node:
@@ -256,7 +287,7 @@ class CircularSinglyLinkedList(LinkedList):
         return tail
 
 
-@dataclasses.dataclass()
+@dataclasses.dataclass(slots=True)
 class _Node:
     value: ValueType
     head: _Node | None = None
@@ -110,7 +110,7 @@ class ListQueue(Queue):
         return node_dequeued.value
 
 
-@dataclasses.dataclass()
+@dataclasses.dataclass(slots=True)
 class _Node:
     value: ValueType
     head: _Node | None = None
@@ -80,7 +80,7 @@ class ListStack(Stack):
         return node_popped.value
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class _Node:
     value: ValueType
     tail: _Node | None
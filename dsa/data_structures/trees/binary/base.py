@@ -8,7 +8,7 @@ from typing import Iterator, Literal, Self, TypeVar
 ValueType = TypeVar("ValueType")
 
 
-@dataclasses.dataclass()
+@dataclasses.dataclass(slots=True)
 class BinaryNode:
     """Binary tree node with at most two children."""
 
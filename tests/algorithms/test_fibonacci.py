@@ -17,8 +17,29 @@ from dsa.algorithms import fibonacci
         fibonacci.fibonacci_memoization,
         fibonacci.fibonacci_tabulation,
         fibonacci.fibonacci_tabulation_spaced_optimized,
+        fibonacci.fibonacci_fast_doubling,
     ],
     ids=lambda f: f.__name__,
 )
 def test_fibonacci(n: int, expected: int, fibonacci_algorithm: fibonacci.FibonacciAlgorithm) -> None:
     assert fibonacci_algorithm(n) == expected
+
+
+@pytest.mark.parametrize(
+    "fibonacci_algorithm",
+    [
+        fibonacci.fibonacci_brute_force,
+        fibonacci.fibonacci_memoization,
+        fibonacci.fibonacci_tabulation_spaced_optimized,
+        fibonacci.fibonacci_fast_doubling,
+    ],
+    ids=lambda f: f.__name__,
+)
+def test_fibonacci_large(fibonacci_algorithm: fibonacci.FibonacciAlgorithm) -> None:
+    assert fibonacci_algorithm(100) == 354224848179261915075
+    assert fibonacci_algorithm(5000) == fibonacci.fibonacci_tabulation(5000)
+
+
+def test_fibonacci_iterative_int64() -> None:
+    for n in range(fibonacci.INT64_MAX_N + 1):
+        assert fibonacci._fibonacci_iterative_int64(n) == fibonacci.fibonacci_fast_doubling(n)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import numpy as np
 import pytest
 
 from dsa.algorithms import knapsack
@@ -17,3 +18,60 @@ def test_knapsack(knapsack_algorithm: knapsack.KnapsackAlgorithm) -> None:
     assert knapsack_algorithm(weights_and_profits=[(2, 1), (5, 8), (1, 2)], capacity=5) == 8
     assert knapsack_algorithm(weights_and_profits=[(2, 1), (5, 8), (1, 2)], capacity=6) == 10
     assert knapsack_algorithm(weights_and_profits=[(5, 10), (4, 40), (6, 30), (3, 50)], capacity=5) == 50
+
+
+@pytest.mark.parametrize(
+    "knapsack_algorithm",
+    [knapsack.knapsack_brute_force, knapsack.knapsack_memoization, knapsack.knapsack_tabulation],
+    ids=lambda f: f.__name__,
+)
+def test_knapsack_zero_weight(knapsack_algorithm: knapsack.KnapsackAlgorithm) -> None:
+    with pytest.raises(ValueError):
+        knapsack_algorithm(weights_and_profits=[(0, 5)], capacity=0)
+    with pytest.raises(ValueError):
+        knapsack_algorithm(weights_and_profits=[(1, 1), (0, 5)], capacity=1)
+
+
+def test_knapsack_random_items() -> None:
+    rng = np.random.default_rng(seed=42)
+    weights_and_profits = [tuple(pair) for pair in rng.integers(1, 20, size=(15, 2)).tolist()]
+    for capacity in [0, 1, 10, 25, 50, 400]:
+        expected = knapsack.knapsack_brute_force(weights_and_profits, capacity)
+        assert knapsack.knapsack_memoization(weights_and_profits, capacity) == expected
+        assert knapsack.knapsack_tabulation(weights_and_profits, capacity) == expected
+
+
+def test_knapsack_tabulation_vectorized(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Skip the compiled kernel, to exercise the NumPy row update
+    monkeypatch.setattr(knapsack, "HAS_NUMBA", False)
+    rng = np.random.default_rng(seed=42)
+    weights_and_profits = [tuple(pair) for pair in rng.integers(1, 20, size=(15, 2)).tolist()]
+    for capacity in [0, 1, 10, 25, 50, 400]:
+        expected = knapsack.knapsack_brute_force(weights_and_profits, capacity)
+        assert knapsack.knapsack_tabulation(weights_and_profits, capacity) == expected
+
+
+def test_knapsack_tabulation_compiled() -> None:
+    weights = np.array([5, 4, 6, 3], dtype=np.int32)
+    profits = np.array([10, 40, 30, 50], dtype=np.int32)
+    assert knapsack._knapsack_tabulation_compiled(weights, profits, 5) == 50
+    assert knapsack._knapsack_tabulation_compiled(weights, profits, 10) == 90
+    assert knapsack._knapsack_tabulation_compiled(weights, profits, 0) == 0
+
+
+@pytest.mark.parametrize(
+    "knapsack_algorithm",
+    [knapsack.knapsack_brute_force, knapsack.knapsack_memoization, knapsack.knapsack_tabulation],
+    ids=lambda f: f.__name__,
+)
+def test_knapsack_beyond_32_bits(knapsack_algorithm: knapsack.KnapsackAlgorithm) -> None:
+    # Items that never fit must not matter, however heavy
+    assert knapsack_algorithm(weights_and_profits=[(2**31, 5), (1, 3)], capacity=4) == 3
+    assert knapsack_algorithm(weights_and_profits=[(2**70, 5), (1, 3)], capacity=4) == 3
+    assert knapsack_algorithm(weights_and_profits=[(1, 2**40), (2, 3)], capacity=3) == 2**40 + 3
+
+
+def test_knapsack_memoization_many_items() -> None:
+    # Deep enough to exceed the recursion limit with a recursive implementation
+    weights_and_profits = 5000 * [(1, 1)]
+    assert knapsack.knapsack_memoization(weights_and_profits, capacity=3) == 3
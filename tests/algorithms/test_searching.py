@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import numpy as np
 import pytest
 
 from dsa.algorithms import searching
@@ -14,3 +15,43 @@ def test_search(search_algorithm: searching.SearchAlgorithm):
         assert search_algorithm(array, value) == index
     with pytest.raises(searching.NotFoundError):
         search_algorithm(array, 100)
+
+
+@pytest.mark.parametrize(
+    "search_algorithm", [searching.linear_search, searching.binary_search_recursive, searching.binary_search_iterative]
+)
+def test_search_tuple(search_algorithm: searching.SearchAlgorithm):
+    array = tuple(range(0, 100, 4))
+    for index, value in enumerate(array):
+        assert search_algorithm(array, value) == index
+    for value in [-1, 1, 100]:
+        with pytest.raises(searching.NotFoundError):
+            search_algorithm(array, value)
+
+
+def test_linear_search_unsorted():
+    array = [8, 3, 5, 3, 1]
+    for value in array:
+        assert searching.linear_search(array, value) == array.index(value)
+        assert searching.linear_search(np.array(array), value) == array.index(value)
+        assert searching.linear_search(tuple(array), value) == array.index(value)
+    with pytest.raises(searching.NotFoundError):
+        searching.linear_search(np.array(array), 4)
+
+
+@pytest.mark.parametrize("search_algorithm", [searching.binary_search_recursive, searching.binary_search_iterative])
+def test_binary_search_duplicates(search_algorithm: searching.SearchAlgorithm):
+    for size in range(8):
+        array = tuple(sorted(2 * (value // 2) for value in range(size)))
+        for value in set(array):
+            assert array[search_algorithm(array, value)] == value
+        with pytest.raises(searching.NotFoundError):
+            search_algorithm(array, 1)
+
+
+def test_binary_search_iterative_numpy():
+    array = np.array([1, 3, 5, 7])
+    for index, value in enumerate(array.tolist()):
+        index_found = searching.binary_search_iterative(array, value)
+        assert index_found == index
+        assert type(index_found) is int
@@ -8,7 +8,11 @@ from dsa.data_structures import graphs
 
 
 @pytest.mark.parametrize("directed", [False, True], ids=["undirected", "directed"])
-@pytest.mark.parametrize("algorithm", [shortest_path.a_star_search_algorithm], ids=lambda f: f.__name__)
+@pytest.mark.parametrize(
+    "algorithm",
+    [shortest_path.a_star_search_algorithm, shortest_path.a_star_search_algorithm_compiled],
+    ids=lambda f: f.__name__,
+)
 def test_shortest_path_two_nodes(algorithm: shortest_path.ShortestPathAlgorithm, directed: bool) -> None:
     # node_1 -- 2.0 -- node_2
     graph = graphs.Graph(directed=directed)
@@ -30,7 +34,11 @@ def test_shortest_path_two_nodes(algorithm: shortest_path.ShortestPathAlgorithm,
 
 
 @pytest.mark.parametrize("directed", [False, True], ids=["undirected", "directed"])
-@pytest.mark.parametrize("algorithm", [shortest_path.a_star_search_algorithm], ids=lambda f: f.__name__)
+@pytest.mark.parametrize(
+    "algorithm",
+    [shortest_path.a_star_search_algorithm, shortest_path.a_star_search_algorithm_compiled],
+    ids=lambda f: f.__name__,
+)
 def test_shortest_path_4_nodes(algorithm: shortest_path.ShortestPathAlgorithm, directed: bool) -> None:
     #             node_2
     #           /        \
@@ -62,7 +70,11 @@ def test_shortest_path_4_nodes(algorithm: shortest_path.ShortestPathAlgorithm, d
 
 
 @pytest.mark.parametrize("directed", [False, True], ids=["undirected", "directed"])
-@pytest.mark.parametrize("algorithm", [shortest_path.a_star_search_algorithm], ids=lambda f: f.__name__)
+@pytest.mark.parametrize(
+    "algorithm",
+    [shortest_path.a_star_search_algorithm, shortest_path.a_star_search_algorithm_compiled],
+    ids=lambda f: f.__name__,
+)
 def test_shortest_path_7_nodes(algorithm: shortest_path.ShortestPathAlgorithm, directed: bool) -> None:
     #            node_3             node_5
     #          /        \          /      \
@@ -102,3 +114,29 @@ def test_shortest_path_7_nodes(algorithm: shortest_path.ShortestPathAlgorithm, d
         path_and_distance = algorithm(graph, source="node_7", target="node_2")
         assert path_and_distance.path == ["node_7", "node_5", "node_4", "node_2"]
         assert path_and_distance.distance == approx(17.0)
+
+
+@pytest.mark.parametrize(
+    "algorithm",
+    [shortest_path.a_star_search_algorithm, shortest_path.a_star_search_algorithm_compiled],
+    ids=lambda f: f.__name__,
+)
+def test_shortest_path_heuristic_called_once_per_node(algorithm: shortest_path.ShortestPathAlgorithm) -> None:
+    # node_1 -- 5.0 -- node_3, but also node_1 -- 1.0 -- node_2 -- 1.0 -- node_3
+    graph = graphs.Graph(directed=True)
+    for value in ["node_1", "node_2", "node_3", "node_4"]:
+        graph.add_value(value)
+    graph.add_connection("node_1", "node_3", weight=5.0)
+    graph.add_connection("node_1", "node_2", weight=1.0)
+    graph.add_connection("node_2", "node_3", weight=1.0)
+    graph.add_connection("node_3", "node_4", weight=1.0)
+    calls = []
+
+    def guess_min_distance_from_target(graph: graphs.Graph, source: str, target: str) -> float:
+        calls.append(source)
+        return 0.0
+
+    path_and_distance = algorithm(graph, "node_1", "node_4", guess_min_distance_from_target)
+    assert path_and_distance.path == ["node_1", "node_2", "node_3", "node_4"]
+    assert path_and_distance.distance == approx(3.0)
+    assert sorted(calls) == sorted(set(calls))
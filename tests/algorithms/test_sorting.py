@@ -1,9 +1,24 @@
 from __future__ import annotations
 
+import array
+import copy
+import dataclasses
+from typing import Callable, Sequence
+
 import numpy as np
 import pytest
 
-from dsa.algorithms import sorting
+from dsa.algorithms import _sorting_numba, sorting
+
+
+@pytest.fixture(params=["numba", "numpy", "python"])
+def backend(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    """Run with the compiled kernels, the NumPy fallbacks, and pure Python, so that all paths get tested."""
+    if request.param != "numba" or not sorting.HAS_NUMBA:
+        monkeypatch.setattr(sorting, "HAS_NUMBA", False)
+    if request.param == "python":
+        monkeypatch.setattr(sorting, "_sort_compiled", lambda *args, **kwargs: False)
+    return request.param
 
 
 @pytest.mark.parametrize(
@@ -17,6 +32,7 @@ from dsa.algorithms import sorting
         [33, 24, 9, 1],
         np.random.default_rng(seed=42).integers(2**16, size=99).tolist(),
         np.random.default_rng(seed=42).integers(2**16, size=100).tolist(),
+        list(range(50)) + list(range(100, 50, -1)) + [1, 1, 0],
     ],
     ids=[
         "0_elements",
@@ -27,23 +43,305 @@ from dsa.algorithms import sorting
         "4_elements_reverse",
         "99_elements_random",
         "100_elements_random",
+        "103_elements_runs",
     ],
 )
 @pytest.mark.parametrize(
     "sorting_algorithm",
     [
         sorting.bubble_sort,
+        sorting.gpu_sort,
         sorting.heap_sort,
         sorting.insertion_sort,
         sorting.merge_sort_top_down,
         sorting.merge_sort_bottom_up,
         sorting.quicksort_lomuto,
         sorting.quicksort_hoare,
+        sorting.radix_sort,
         sorting.selection_sort,
+        sorting.sort,
     ],
     ids=lambda x: x.__name__,
 )
-def test_sorting(array_input: list[int], sorting_algorithm: sorting.SortingAlgorithm) -> None:
+def test_sorting(array_input: list[int], sorting_algorithm: sorting.SortingAlgorithm, backend: str) -> None:
     array_expected = sorted(array_input)
     array_returned = sorting_algorithm(list(array_input))
     assert array_returned == array_expected
+
+
+@pytest.mark.parametrize(
+    "array_input",
+    [
+        [3.5, -1.0, 2.25, 0.0],
+        [2**70, 3, -(2**70)],
+        [True, 2, 1],
+        ["banana", "apple", "cherry"],
+    ],
+    ids=["floats", "big_integers", "mixed_types", "strings"],
+)
+@pytest.mark.parametrize(
+    "sorting_algorithm",
+    [
+        sorting.bubble_sort,
+        sorting.insertion_sort,
+        sorting.merge_sort_top_down,
+        sorting.merge_sort_bottom_up,
+        sorting.selection_sort,
+    ],
+    ids=lambda x: x.__name__,
+)
+def test_sorting_value_types(array_input: list, sorting_algorithm: sorting.SortingAlgorithm) -> None:
+    array_returned = sorting_algorithm(list(array_input))
+    assert array_returned == sorted(array_input)
+    assert [type(value) for value in array_returned] == [type(value) for value in sorted(array_input)]
+
+
+@pytest.mark.parametrize(
+    "kernel",
+    [
+        _sorting_numba.bubble_sort_compiled,
+        _sorting_numba.insertion_sort_compiled,
+        _sorting_numba.merge_sort_top_down_compiled,
+        _sorting_numba.merge_sort_bottom_up_compiled,
+        _sorting_numba.quicksort_lomuto_compiled,
+        _sorting_numba.quicksort_hoare_compiled,
+        _sorting_numba.selection_sort_compiled,
+    ],
+    ids=lambda x: x.__name__,
+)
+@pytest.mark.parametrize("dtype", [np.int64, np.float64])
+def test_sorting_compiled(kernel: Callable[[np.ndarray], None], dtype: type) -> None:
+    array = np.random.default_rng(seed=42).integers(-(2**16), 2**16, size=100).astype(dtype)
+    array_expected = np.sort(array)
+    kernel(array)
+    np.testing.assert_array_equal(array, array_expected)
+
+
+@pytest.mark.parametrize(
+    "array_input",
+    [
+        np.random.default_rng(seed=42).integers(-(2**16), 2**16, size=10_000),
+        np.random.default_rng(seed=42).integers(3, size=10_000),
+        np.arange(10_000),
+        np.arange(10_000)[::-1],
+        np.full(10_000, 7),
+        np.concatenate([np.arange(5000), np.arange(5000)]),
+    ],
+    ids=["random", "few_unique", "sorted", "reverse", "all_equal", "sawtooth"],
+)
+@pytest.mark.parametrize(
+    "kernel",
+    [_sorting_numba.quicksort_lomuto_compiled, _sorting_numba.quicksort_hoare_compiled],
+    ids=lambda x: x.__name__,
+)
+def test_quicksort_compiled_large(array_input: np.ndarray, kernel: Callable[[np.ndarray], None]) -> None:
+    # Large enough for block partitioning and ninthers
+    array = array_input.astype(np.int64)
+    kernel(array)
+    np.testing.assert_array_equal(array, np.sort(array_input))
+
+
+def test_heap_sort_in_place() -> None:
+    array = [5, 1, 4, 2, 3]
+    assert sorting.heap_sort(array) is array
+    assert array == [1, 2, 3, 4, 5]
+
+
+@dataclasses.dataclass(order=True)
+class _Item:
+    key: int
+    position: int = dataclasses.field(compare=False)
+
+
+@pytest.mark.parametrize(
+    "sorting_algorithm", [sorting.merge_sort_top_down, sorting.merge_sort_bottom_up], ids=lambda x: x.__name__
+)
+def test_merge_sort_stable(sorting_algorithm: sorting.SortingAlgorithm) -> None:
+    # Ascending, descending and random runs, with many equal keys
+    keys = (
+        list(range(100))
+        + list(range(300, 0, -3))
+        + [5] * 10
+        + np.random.default_rng(seed=42).integers(20, size=300).tolist()
+    )
+    array = [_Item(key, position) for position, key in enumerate(keys)]
+    array_returned = sorting_algorithm(list(array))
+    # Python's sort is stable
+    assert [(item.key, item.position) for item in array_returned] == [
+        (item.key, item.position) for item in sorted(array)
+    ]
+
+
+def test_merge_sort_bottom_up_python_array() -> None:
+    # Unsigned 64-bit values have no compiled kernel, so they take the Python path,
+    # and the array is longer than a single run
+    values = list(range(100, 0, -1)) + [2**64 - 1]
+    array_returned = sorting.merge_sort_bottom_up(array.array("Q", values))
+    assert array_returned == array.array("Q", sorted(values))
+
+
+def test_merge_sort_bottom_up_many_runs() -> None:
+    # Ascending runs of random lengths, so that merges get triggered at various depths of the stack
+    rng = np.random.default_rng(seed=42)
+    keys: list[int] = []
+    for size in rng.integers(1, 300, size=100):
+        keys += sorted(rng.integers(1000, size=size).tolist())
+    array = [_Item(key, position) for position, key in enumerate(keys)]
+    array_returned = sorting.merge_sort_bottom_up(list(array))
+    assert [(item.key, item.position) for item in array_returned] == [
+        (item.key, item.position) for item in sorted(array)
+    ]
+
+
+@pytest.mark.parametrize(
+    "size, min_run_expected", [(0, 0), (63, 63), (64, 32), (65, 33), (128, 32), (2**20, 32), (2**20 + 1, 33)]
+)
+def test_get_min_run(size: int, min_run_expected: int) -> None:
+    assert sorting._get_min_run(size) == min_run_expected
+
+
+@pytest.mark.parametrize(
+    "sorting_algorithm", [sorting.quicksort_lomuto, sorting.quicksort_hoare], ids=lambda x: x.__name__
+)
+def test_quicksort_presorted(sorting_algorithm: sorting.SortingAlgorithm) -> None:
+    # Deep enough to exceed the recursion limit, if the pivot was the first or last element
+    array_expected = list(range(5000))
+    assert sorting_algorithm(list(array_expected)) == array_expected
+    assert sorting_algorithm(array_expected[::-1]) == array_expected
+
+
+@pytest.mark.parametrize(
+    "sorting_algorithm", [sorting.quicksort_lomuto, sorting.quicksort_hoare], ids=lambda x: x.__name__
+)
+def test_quicksort_all_equal(sorting_algorithm: sorting.SortingAlgorithm) -> None:
+    # Lomuto puts all elements on one side of the pivot, which used to exceed the recursion limit
+    assert sorting_algorithm(2000 * [7]) == 2000 * [7]
+
+
+@pytest.mark.parametrize(
+    "sorting_algorithm", [sorting.quicksort_lomuto, sorting.quicksort_hoare], ids=lambda x: x.__name__
+)
+def test_quicksort_heap_sort_fallback(
+    sorting_algorithm: sorting.SortingAlgorithm, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Always picking the smallest element as pivot splits off one element at a time
+    monkeypatch.setattr(sorting, "_sort_compiled", lambda *args, **kwargs: False)
+    monkeypatch.setattr(sorting, "_median_of_three", lambda array, index_1, index_2, index_3: index_1)
+    ranges_heap_sorted = []
+
+    def heap_sort_range(array: list[int], index_left: int, index_right: int) -> None:
+        ranges_heap_sorted.append((index_left, index_right))
+        array[index_left:index_right] = sorted(array[index_left:index_right])
+
+    monkeypatch.setattr(sorting, "_heap_sort_range", heap_sort_range)
+    array_expected = list(range(1000))
+    assert sorting_algorithm(list(array_expected)) == array_expected
+    assert len(ranges_heap_sorted) == 1
+
+
+@pytest.mark.parametrize("size", [17, 128, 129, 1000])
+def test_select_pivot(size: int) -> None:
+    # Median of three or ninther, both pick the middle of sorted input
+    assert sorting._select_pivot(list(range(size)), 0, size) == size // 2
+    array = np.random.default_rng(seed=42).permutation(size)
+    assert _sorting_numba._select_pivot_compiled(array, 0, size) == sorting._select_pivot(array.tolist(), 0, size)
+
+
+@pytest.mark.parametrize("dtype", [np.int64, np.float64])
+@pytest.mark.parametrize("size", [0, 1, 2, 3, 100, 101])
+def test_heap_sort_range_compiled(size: int, dtype: type) -> None:
+    array = np.random.default_rng(seed=42).integers(-(2**16), 2**16, size=size + 10).astype(dtype)
+    array_expected = array.copy()
+    array_expected[5 : size + 5].sort()
+    _sorting_numba._heap_sort_range_compiled(array, 5, size + 5)
+    np.testing.assert_array_equal(array, array_expected)
+
+
+def test_radix_sort_range() -> None:
+    array = [2**62, -1, 0, -(2**63), 2**63 - 1, 255, 256, -256, 5, 5]
+    assert sorting.radix_sort(list(array)) == sorted(array)
+    for array in [[1.5, 0.5], [2**64, 0]]:
+        with pytest.raises(TypeError):
+            sorting.radix_sort(array)
+
+
+@pytest.mark.parametrize(
+    "array_input",
+    [
+        np.array([3, -1, 2, 0], dtype=np.int64),
+        np.array([3, -1, 2, 0], dtype=np.int32),
+        np.array([3, 1, 2, 0], dtype=np.uint8),
+        np.array([2**64 - 1, 1, 2**63, 0], dtype=np.uint64),
+        np.array([3.5, -1.0, 2.25, 0.0]),
+        np.array([3, -1, 2, 0, 7, 1], dtype=np.int64)[::2],
+        array.array("q", [3, -1, 2, 0]),
+        array.array("d", [3.5, -1.0, 2.25, 0.0]),
+        array.array("i", [3, -1, 2, 0]),
+        array.array("f", [3.5, -1.0, 2.25, 0.0]),
+    ],
+    ids=[
+        "ndarray_int64",
+        "ndarray_int32",
+        "ndarray_uint8",
+        "ndarray_uint64",
+        "ndarray_float64",
+        "ndarray_strided",
+        "array_q",
+        "array_d",
+        "array_i",
+        "array_f",
+    ],
+)
+@pytest.mark.parametrize(
+    "sorting_algorithm",
+    [
+        sorting.bubble_sort,
+        sorting.gpu_sort,
+        sorting.heap_sort,
+        sorting.insertion_sort,
+        sorting.merge_sort_top_down,
+        sorting.merge_sort_bottom_up,
+        sorting.quicksort_lomuto,
+        sorting.quicksort_hoare,
+        sorting.radix_sort,
+        sorting.selection_sort,
+        sorting.sort,
+    ],
+    ids=lambda x: x.__name__,
+)
+def test_sorting_buffers(array_input: Sequence, sorting_algorithm: sorting.SortingAlgorithm, backend: str) -> None:
+    if sorting_algorithm is sorting.radix_sort and np.asarray(array_input).dtype.kind == "f":
+        with pytest.raises(TypeError):
+            sorting_algorithm(copy.copy(array_input))
+        return
+    array_expected = sorted(array_input)
+    array_returned = sorting_algorithm(copy.copy(array_input))
+    assert list(array_returned) == array_expected
+
+
+def test_merge_sort_bottom_up_compiled_parallel() -> None:
+    array = np.random.default_rng(seed=42).integers(2**16, size=_sorting_numba.PARALLEL_MIN_SIZE + 1000)
+    array_expected = np.sort(array)
+    _sorting_numba.merge_sort_bottom_up_compiled(array)
+    np.testing.assert_array_equal(array, array_expected)
+
+
+@pytest.mark.parametrize("num_pieces", [1, 2, 3, 8, 100])
+def test_sort_and_merge_parallel_compiled(num_pieces: int) -> None:
+    rng = np.random.default_rng(seed=42)
+    # Small range of values, so that there are many ties across the two runs
+    source = np.concatenate([np.sort(rng.integers(10, size=37)), np.sort(rng.integers(10, size=50))])
+    target = np.zeros_like(source)
+    _sorting_numba.sort_and_merge_parallel_compiled(source, target, 0, 37, 87, num_pieces)
+    np.testing.assert_array_equal(target, np.sort(source))
+
+
+@pytest.mark.parametrize(
+    ("source", "index_middle"),
+    [([], 0), ([1, 2], 0), ([1, 2], 2), ([2, 3, 1, 4], 2), ([1, 1, 1, 0], 3)],
+    ids=["both_empty", "left_empty", "right_empty", "interleaved", "ties"],
+)
+def test_sort_and_merge(source: list[int], index_middle: int) -> None:
+    target = len(source) * [None]
+    sorting._sort_and_merge(source, target, 0, index_middle, len(source))
+    assert target == sorted(source)
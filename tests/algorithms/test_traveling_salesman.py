@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import itertools
+import math
+
+import numpy as np
 import pytest
 from pytest import approx
 
@@ -9,7 +13,11 @@ from dsa.data_structures import graphs
 
 @pytest.mark.parametrize(
     "algorithm",
-    [traveling_salesman.traveling_salesman_brute_force, traveling_salesman.traveling_salesman_recursion],
+    [
+        traveling_salesman.traveling_salesman_brute_force,
+        traveling_salesman.traveling_salesman_recursion,
+        traveling_salesman.traveling_salesman_dynamic_programming,
+    ],
     ids=lambda f: f.__name__,
 )
 def test_traveling_salesman(algorithm: traveling_salesman.TravelingSalesmanAlgorithm) -> None:
@@ -29,3 +37,82 @@ def test_traveling_salesman(algorithm: traveling_salesman.TravelingSalesmanAlgor
 
     assert path == ["city_1", "city_2", "city_4", "city_3", "city_1"]
     assert distance == approx(80.0)
+
+
+@pytest.mark.parametrize(
+    "algorithm",
+    [
+        traveling_salesman.traveling_salesman_brute_force,
+        traveling_salesman.traveling_salesman_recursion,
+        traveling_salesman.traveling_salesman_dynamic_programming,
+    ],
+    ids=lambda f: f.__name__,
+)
+def test_traveling_salesman_single_city(algorithm: traveling_salesman.TravelingSalesmanAlgorithm) -> None:
+    graph = graphs.Graph(directed=False)
+    graph.add_value("city_1")
+
+    path, distance = algorithm(graph)
+
+    assert path == ["city_1", "city_1"]
+    assert distance == 0.0
+
+
+@pytest.mark.parametrize(
+    "algorithm",
+    [
+        traveling_salesman.traveling_salesman_brute_force,
+        traveling_salesman.traveling_salesman_recursion,
+        traveling_salesman.traveling_salesman_dynamic_programming,
+    ],
+    ids=lambda f: f.__name__,
+)
+def test_traveling_salesman_no_city(algorithm: traveling_salesman.TravelingSalesmanAlgorithm) -> None:
+    path, distance = algorithm(graphs.Graph(directed=False))
+
+    assert path == []
+    assert distance == math.inf
+
+
+@pytest.mark.parametrize(
+    "algorithm",
+    [traveling_salesman.traveling_salesman_recursion, traveling_salesman.traveling_salesman_dynamic_programming],
+    ids=lambda f: f.__name__,
+)
+@pytest.mark.parametrize("directed", [True, False], ids=["directed", "undirected"])
+def test_traveling_salesman_random(algorithm: traveling_salesman.TravelingSalesmanAlgorithm, directed: bool) -> None:
+    graph = _build_random_graph(num_cities=7, directed=directed)
+
+    path, distance = algorithm(graph)
+    _, distance_expected = traveling_salesman.traveling_salesman_brute_force(graph)
+
+    assert distance == approx(distance_expected)
+    assert path[0] == path[-1] == "city_0"
+    assert sorted(path[:-1]) == graph.values
+    assert sum(graph.get_connection_weight(*cities_pair) for cities_pair in itertools.pairwise(path)) == approx(
+        distance
+    )
+
+
+def test_traveling_salesman_brute_force_chunks(monkeypatch: pytest.MonkeyPatch) -> None:
+    graph = _build_random_graph(num_cities=6, directed=True)
+    path_expected, distance_expected = traveling_salesman.traveling_salesman_brute_force(graph)
+
+    # Smallest path found in a later chunk than the first one
+    monkeypatch.setattr(traveling_salesman, "PATHS_PER_CHUNK", 7)
+    path, distance = traveling_salesman.traveling_salesman_brute_force(graph)
+
+    assert path == path_expected
+    assert distance == approx(distance_expected)
+
+
+def _build_random_graph(num_cities: int, directed: bool) -> graphs.Graph:
+    rng = np.random.default_rng(seed=42)
+    graph = graphs.Graph(directed=directed)
+    cities = [f"city_{index}" for index in range(num_cities)]
+    for city in cities:
+        graph.add_value(city)
+    for city_1, city_2 in itertools.permutations(cities, 2):
+        if not graph.has_connection(city_1, city_2):
+            graph.add_connection(city_1, city_2, weight=float(rng.integers(1, 100)))
+    return graph
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+import numpy as np
 import pytest
 
 from dsa.data_structures import graphs
 
 
 @pytest.mark.parametrize("directed", [True, False], ids=["directed", "undirected"])
-@pytest.mark.parametrize("representation", ["adjacency_list", "adjacency_matrix", "pointers_and_objects"])
+@pytest.mark.parametrize(
+    "representation", ["adjacency_list", "compressed_sparse_row", "adjacency_matrix", "pointers_and_objects"]
+)
 def test_graph_add_value(directed: bool, representation: str) -> None:
     graph = graphs.Graph(representation=representation, directed=directed)
     assert not graph.has_value("1")
@@ -25,7 +28,9 @@ def test_graph_add_value(directed: bool, representation: str) -> None:
 
 
 @pytest.mark.parametrize("directed", [True, False], ids=["directed", "undirected"])
-@pytest.mark.parametrize("representation", ["adjacency_list", "adjacency_matrix", "pointers_and_objects"])
+@pytest.mark.parametrize(
+    "representation", ["adjacency_list", "compressed_sparse_row", "adjacency_matrix", "pointers_and_objects"]
+)
 def test_graph_delete_value(directed: bool, representation: str) -> None:
     graph = graphs.Graph(representation=representation, directed=directed)
     graph.add_value("1")
@@ -46,7 +51,32 @@ def test_graph_delete_value(directed: bool, representation: str) -> None:
 
 
 @pytest.mark.parametrize("directed", [True, False], ids=["directed", "undirected"])
-@pytest.mark.parametrize("representation", ["adjacency_list", "adjacency_matrix", "pointers_and_objects"])
+@pytest.mark.parametrize(
+    "representation", ["adjacency_list", "compressed_sparse_row", "adjacency_matrix", "pointers_and_objects"]
+)
+def test_graph_delete_value_in_the_middle(directed: bool, representation: str) -> None:
+    graph = graphs.Graph(representation=representation, directed=directed)
+    for value in ["1", "2", "3", "4"]:
+        graph.add_value(value)
+    graph.add_connection("1", "3")
+    graph.add_connection("3", "4")
+
+    graph.delete_value("2")
+    assert graph.values == ["1", "3", "4"]
+    assert graph.has_connection("1", "3")
+    assert graph.has_connection("3", "4")
+    assert not graph.has_connection("1", "4")
+    assert list(graph.traverse_BFS("1")) == ["1", "3", "4"]
+
+    graph.add_value("2")
+    assert graph.values == ["1", "3", "4", "2"]
+    assert not graph.has_connection("1", "2")
+
+
+@pytest.mark.parametrize("directed", [True, False], ids=["directed", "undirected"])
+@pytest.mark.parametrize(
+    "representation", ["adjacency_list", "compressed_sparse_row", "adjacency_matrix", "pointers_and_objects"]
+)
 def test_graph_add_connection(directed: bool, representation: str) -> None:
     graph = graphs.Graph(representation=representation, directed=directed)
     graph.add_value("1")
@@ -68,7 +98,49 @@ def test_graph_add_connection(directed: bool, representation: str) -> None:
 
 
 @pytest.mark.parametrize("directed", [True, False], ids=["directed", "undirected"])
-@pytest.mark.parametrize("representation", ["adjacency_list", "adjacency_matrix", "pointers_and_objects"])
+@pytest.mark.parametrize(
+    "representation", ["adjacency_list", "compressed_sparse_row", "adjacency_matrix", "pointers_and_objects"]
+)
+def test_graph_get_connection_weight(directed: bool, representation: str) -> None:
+    graph = graphs.Graph(representation=representation, directed=directed)
+    graph.add_value("1")
+    graph.add_value("2")
+    graph.add_value("3")
+    graph.add_connection("1", "2", weight=2.5)
+    graph.add_connection("2", "3", weight=4.0)
+
+    assert graph.get_connection_weight("1", "2") == 2.5
+    assert graph.get_connection_weight("2", "3") == 4.0
+    if directed:
+        with pytest.raises(AssertionError):
+            graph.get_connection_weight("2", "1")
+    else:
+        assert graph.get_connection_weight("2", "1") == 2.5
+    with pytest.raises(AssertionError):
+        graph.get_connection_weight("1", "3")
+
+
+@pytest.mark.parametrize("directed", [True, False], ids=["directed", "undirected"])
+@pytest.mark.parametrize(
+    "representation", ["adjacency_list", "compressed_sparse_row", "adjacency_matrix", "pointers_and_objects"]
+)
+def test_graph_delete_value_connected(directed: bool, representation: str) -> None:
+    graph = graphs.Graph(representation=representation, directed=directed)
+    for value in ["1", "2", "3"]:
+        graph.add_value(value)
+    graph.add_connection("1", "2")
+    graph.add_connection("1", "3", weight=3.0)
+    graph.add_connection("3", "2")
+
+    graph.delete_value("2")
+    assert list(graph.iterate_neighbors("1")) == [("3", 3.0)]
+    assert list(graph.iterate_neighbors("3")) == ([] if directed else [("1", 3.0)])
+
+
+@pytest.mark.parametrize("directed", [True, False], ids=["directed", "undirected"])
+@pytest.mark.parametrize(
+    "representation", ["adjacency_list", "compressed_sparse_row", "adjacency_matrix", "pointers_and_objects"]
+)
 def test_graph_delete_connection(directed: bool, representation: str) -> None:
     graph = graphs.Graph(representation=representation, directed=directed)
     graph.add_value("1")
@@ -89,7 +161,9 @@ def test_graph_delete_connection(directed: bool, representation: str) -> None:
 
 
 @pytest.mark.parametrize("directed", [True, False], ids=["directed", "undirected"])
-@pytest.mark.parametrize("representation", ["adjacency_list", "adjacency_matrix", "pointers_and_objects"])
+@pytest.mark.parametrize(
+    "representation", ["adjacency_list", "compressed_sparse_row", "adjacency_matrix", "pointers_and_objects"]
+)
 def test_graph_iterate_neighbors(directed: bool, representation: str) -> None:
     graph = graphs.Graph(representation=representation, directed=directed)
     graph.add_value("1")
@@ -107,8 +181,24 @@ def test_graph_iterate_neighbors(directed: bool, representation: str) -> None:
         list(graph.iterate_neighbors("3")) == [("2", 1.0)]
 
 
+@pytest.mark.parametrize(
+    "representation", ["adjacency_list", "compressed_sparse_row", "adjacency_matrix", "pointers_and_objects"]
+)
+def test_graph_iterate_neighbors_sorted(representation: str) -> None:
+    graph = graphs.Graph(representation=representation)
+    for value in ["1", "2", "3", "4"]:
+        graph.add_value(value)
+    graph.add_connection("1", "4", weight=4.0)
+    graph.add_connection("1", "2", weight=2.0)
+    graph.add_connection("1", "3", weight=3.0)
+
+    assert list(graph.iterate_neighbors("1")) == [("2", 2.0), ("3", 3.0), ("4", 4.0)]
+
+
 @pytest.mark.parametrize("directed", [True, False], ids=["directed", "undirected"])
-@pytest.mark.parametrize("representation", ["adjacency_list", "adjacency_matrix", "pointers_and_objects"])
+@pytest.mark.parametrize(
+    "representation", ["adjacency_list", "compressed_sparse_row", "adjacency_matrix", "pointers_and_objects"]
+)
 def test_graph_traverse_BFS(directed: bool, representation: str) -> None:
     #   1
     #  / \
@@ -141,7 +231,9 @@ def test_graph_traverse_BFS(directed: bool, representation: str) -> None:
 
 
 @pytest.mark.parametrize("directed", [True, False], ids=["directed", "undirected"])
-@pytest.mark.parametrize("representation", ["adjacency_list", "adjacency_matrix", "pointers_and_objects"])
+@pytest.mark.parametrize(
+    "representation", ["adjacency_list", "compressed_sparse_row", "adjacency_matrix", "pointers_and_objects"]
+)
 def test_graph_traverse_DFS(directed: bool, representation: str) -> None:
     #   1
     #  / \
@@ -175,3 +267,34 @@ def test_graph_traverse_DFS(directed: bool, representation: str) -> None:
         assert list(graph.traverse_DFS("3")) == ["3", "1", "2", "4", "5", "6"]
         assert list(graph.traverse_DFS("4")) == ["4", "3", "1", "2", "5", "6"]
         assert list(graph.traverse_DFS("5")) == ["5", "3", "1", "2", "4", "6"]
+
+
+@pytest.mark.parametrize("representation", ["adjacency_list", "compressed_sparse_row", "pointers_and_objects"])
+def test_graph_traverse_DFS_deep(representation: str) -> None:
+    # A path deeper than the recursion limit
+    graph = graphs.Graph(representation=representation)
+    values = list(range(3000))
+    for value in values:
+        graph.add_value(value)
+    for value_1, value_2 in zip(values, values[1:]):
+        graph.add_connection(value_1, value_2)
+
+    assert list(graph.traverse_DFS(0)) == values
+
+
+@pytest.mark.parametrize("directed", [True, False], ids=["directed", "undirected"])
+def test_graph_traverse_BFS_adjacency_matrix_order(directed: bool) -> None:
+    # Same order as a first in, first out queue over the other representations
+    rng = np.random.default_rng(0)
+    graph_matrix = graphs.Graph(representation="adjacency_matrix", directed=directed)
+    graph_list = graphs.Graph(representation="adjacency_list", directed=directed)
+    for graph in [graph_matrix, graph_list]:
+        for value in range(50):
+            graph.add_value(value)
+    for value_1, value_2 in rng.integers(50, size=(100, 2)).tolist():
+        if value_1 != value_2 and not graph_list.has_connection(value_1, value_2):
+            graph_matrix.add_connection(value_1, value_2)
+            graph_list.add_connection(value_1, value_2)
+
+    for value in range(50):
+        assert list(graph_matrix.traverse_BFS(value)) == list(graph_list.traverse_BFS(value))
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import random
+
 import pytest
 from pytest import approx
 
@@ -54,3 +56,120 @@ def test_hash_table_handle_collisions(
 
     for key in range(2, 40, 2):
         assert table[key] == str(key)
+
+
+@pytest.mark.parametrize("num_buckets", [4, 8, 16, 32], ids=lambda s: f"{s}_bucket")
+def test_multiplication_method_spreads_keys(num_buckets: int):
+    indices = [hash_tables.multiplication_method(key, num_buckets) for key in range(4 * num_buckets)]
+    assert all(0 <= index < num_buckets for index in indices)
+    assert len(set(indices)) == num_buckets
+
+
+@pytest.mark.parametrize("hash_function", hash_functions, ids=lambda c: c.__name__)
+@pytest.mark.parametrize("table_type", table_types, ids=lambda c: c.__name__)
+def test_hash_table_rehash_many(table_type: type[hash_tables.HashTable], hash_function: hash_tables.HashFunction):
+    table = table_type(hash_function=hash_function, num_buckets=4)
+    keys = list(range(0, 3000, 3))
+    for key in keys:
+        table[key] = str(key)
+
+    assert sorted(table.keys()) == keys
+    assert all(table[key] == str(key) for key in keys)
+    assert table.load_factor <= 0.75
+
+
+@pytest.mark.parametrize("table_type", table_types, ids=lambda c: c.__name__)
+def test_hash_table_remove_missing(table_type: type[hash_tables.HashTable]):
+    table = table_type(hash_function=hash_tables.division_method, num_buckets=8)
+    table[1] = "1"
+
+    table[2] = None
+
+    assert list(table.items()) == [(1, "1")]
+    assert table.load_factor == approx(1.0 / 8.0)
+
+
+@pytest.mark.parametrize("num_buckets", [1, 2, 4, 8, 16, 32], ids=lambda s: f"{s}_bucket")
+@pytest.mark.parametrize("table_type", table_types[1:], ids=lambda c: c.__name__)
+def test_open_addressing_probe_all_buckets(table_type: type[hash_tables.HashTable], num_buckets: int):
+    # All keys are hashed to the first bucket, so the probes must reach all others
+    table = table_type(hash_function=hash_tables.division_method, num_buckets=num_buckets)
+    keys = [num_buckets * multiple for multiple in range(num_buckets)]
+    for key in keys:
+        table._insert_value(key, str(key))
+
+    assert sorted(table.keys()) == keys
+    assert all(table[key] == str(key) for key in keys)
+    with pytest.raises(AssertionError):
+        table._insert_value(num_buckets * num_buckets, "full")
+
+
+@pytest.mark.parametrize("table_type", table_types[1:], ids=lambda c: c.__name__)
+def test_open_addressing_find_after_deleted(table_type: type[hash_tables.HashTable]):
+    # Deleting a key must not hide the keys probed past it
+    table = table_type(hash_function=hash_tables.division_method, num_buckets=16)
+    for key in [0, 16, 32]:
+        table[key] = str(key)
+
+    table[16] = None
+
+    assert table[16] is None
+    assert table[32] == "32"
+    table[48] = "48"
+    assert sorted(table.items()) == [(0, "0"), (32, "32"), (48, "48")]
+    assert table.load_factor == approx(3.0 / 16.0)
+
+
+def test_open_addressing_round_up_num_buckets():
+    table = hash_tables.LinearProbingHashTable(hash_function=hash_tables.division_method, num_buckets=10)
+    assert table.num_buckets == 16
+
+
+@pytest.mark.parametrize("hash_function", hash_functions, ids=lambda c: c.__name__)
+@pytest.mark.parametrize("table_type", table_types, ids=lambda c: c.__name__)
+def test_hash_table_random_operations(table_type: type[hash_tables.HashTable], hash_function: hash_tables.HashFunction):
+    # Interleaved insertions, updates and deletions, checked against a dict
+    rng = random.Random(0)
+    table = table_type(hash_function=hash_function, num_buckets=4)
+    expected = {}
+    for _ in range(2000):
+        key = rng.randrange(-100, 400)
+        value = None if rng.random() < 0.4 else rng.random()
+        table[key] = value
+        if value is None:
+            expected.pop(key, None)
+        else:
+            expected[key] = value
+
+    assert dict(table.items()) == expected
+    assert all(table[key] == value for key, value in expected.items())
+    assert all(table[key] is None for key in range(-100, 400) if key not in expected)
+    assert table.load_factor == approx(len(expected) / table.num_buckets)
+
+
+@pytest.mark.parametrize("num_buckets", [1, 3, 8, 10, 16], ids=lambda s: f"{s}_bucket")
+def test_division_method(num_buckets: int):
+    for key in range(-50, 50):
+        assert hash_tables.division_method(key, num_buckets) == key % num_buckets
+
+
+@pytest.mark.parametrize("hash_function", hash_functions, ids=lambda c: c.__name__)
+@pytest.mark.parametrize("table_type", table_types, ids=lambda c: c.__name__)
+def test_hash_table_keys_beyond_64_bits(
+    table_type: type[hash_tables.HashTable], hash_function: hash_tables.HashFunction
+):
+    table = table_type(hash_function=hash_function, num_buckets=8)
+    assert table[2**63] is None
+    keys_small = list(range(-5, 5))
+    keys_large = [2**63, -(2**63) - 1, 2**100, -(2**100)]
+    for key in keys_small + keys_large:
+        table[key] = str(key)
+
+    assert all(table[key] == str(key) for key in keys_small + keys_large)
+    assert sorted(table.keys()) == sorted(keys_small + keys_large)
+
+    for key in keys_large:
+        table[key] = None
+    assert all(table[key] is None for key in keys_large)
+    assert all(table[key] == str(key) for key in keys_small)
+    assert table.load_factor == approx(len(keys_small) / table.num_buckets)
@@ -79,3 +79,50 @@ def test_doubly_linked_list_inverse_traverse() -> None:
     values = [1, 2, 4, 8]
     linked_list = linked_lists.DoublyLinkedList(values)
     assert list(linked_list.traverse_reverse()) == values[::-1]
+
+
+@pytest.mark.parametrize(
+    "list_type",
+    [
+        linked_lists.SinglyLinkedList,
+        linked_lists.DoublyLinkedList,
+        linked_lists.CircularSinglyLinkedList,
+    ],
+    ids=lambda c: c.__name__,
+)
+def test_linked_list_len(list_type: type[linked_lists.LinkedList]) -> None:
+    values = [1, 2, 4]
+    linked_list = list_type(values)
+    assert len(linked_list) == 3
+
+    linked_list.insert(3, 8)
+    linked_list.insert(0, 0)
+    assert len(linked_list) == 5
+
+    # Delete last element, then insert at the end again
+    linked_list.delete(4)
+    linked_list.insert(4, 16)
+    assert len(linked_list) == 5
+    assert list(linked_list) == [0, 1, 2, 4, 16]
+
+    for _ in range(5):
+        linked_list.delete(0)
+    assert len(linked_list) == 0
+    assert list(linked_list) == []
+
+
+@pytest.mark.parametrize(
+    "list_type",
+    [
+        linked_lists.SinglyLinkedList,
+        linked_lists.DoublyLinkedList,
+        linked_lists.CircularSinglyLinkedList,
+    ],
+    ids=lambda c: c.__name__,
+)
+def test_linked_list_index_out_of_range(list_type: type[linked_lists.LinkedList]) -> None:
+    linked_list = list_type([1, 2, 4])
+    for index in [-1, 3]:
+        with pytest.raises(IndexError):
+            linked_list[index]
+    assert list_type()._get_first_node() is None